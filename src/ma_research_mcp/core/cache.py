@@ -0,0 +1,241 @@
+"""
+In-process caching for M&A Research Assistant
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import orjson
+from cachetools import TTLCache
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class S3ObjectCache:
+    """TTL cache of S3 object bodies keyed by S3 key
+
+    S3 calls run in worker threads, so a read can still be in flight while
+    the same key is overwritten. Every write bumps ``generation`` and a read
+    only fills the cache if no write happened since it started.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.generation = 0
+
+    def get(self, s3_key: str) -> Optional[bytes]:
+        return self._cache.get(s3_key)
+
+    def put(self, s3_key: str, body: bytes, generation: int) -> None:
+        """Cache a body read when the cache was at ``generation``"""
+        if generation == self.generation:
+            self._cache[s3_key] = body
+
+    def invalidate(self, s3_key: str) -> None:
+        self.generation += 1
+        self._cache.pop(s3_key, None)
+
+
+@lru_cache(maxsize=1)
+def get_s3_object_cache() -> S3ObjectCache:
+    """Get cache of S3 JSON object bodies"""
+    return S3ObjectCache(maxsize=1024, ttl=get_config().CACHE_ANALYSIS_SECONDS)
+
+
+def invalidate(s3_key: str) -> None:
+    """Drop a cached S3 object, e.g. after it has been overwritten"""
+    get_s3_object_cache().invalidate(s3_key)
+
+
+class LinkedInCache:
+    """SQLite-backed TTL cache of LinkedIn company data keyed by URL
+
+    Entries outlive the process so repeat lookups skip the Apify actor run
+    entirely. sqlite3 calls block, so they run in a worker thread over one
+    shared connection guarded by a lock.
+
+    The cache never fails a lookup: database or filesystem errors are
+    logged and treated as a miss (reads) or skipped (writes).
+    """
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table on first use"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS linkedin_cache ("
+                "url TEXT PRIMARY KEY, structured_json BLOB NOT NULL, "
+                "raw_json BLOB NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _select(self, url: str) -> Optional[tuple]:
+        with self._lock:
+            return self._connect().execute(
+                "SELECT structured_json, raw_json, fetched_at FROM linkedin_cache WHERE url = ?",
+                (url,)
+            ).fetchone()
+
+    def _select_many(self, urls: List[str]) -> List[tuple]:
+        rows = []
+        with self._lock:
+            conn = self._connect()
+            # Stay under SQLite's default limit on bound parameters
+            for i in range(0, len(urls), 500):
+                chunk = urls[i:i + 500]
+                rows.extend(conn.execute(
+                    "SELECT url, structured_json, raw_json, fetched_at FROM linkedin_cache "
+                    f"WHERE url IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall())
+        return rows
+
+    def _upsert(self, rows: List[tuple]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO linkedin_cache VALUES (?, ?, ?, ?)", rows
+                )
+
+    def _delete(self, url: Optional[str]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if url is None:
+                    conn.execute("DELETE FROM linkedin_cache")
+                else:
+                    conn.execute("DELETE FROM linkedin_cache WHERE url = ?", (url,))
+
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached company data for a URL if it has not expired"""
+        try:
+            row = await asyncio.to_thread(self._select, url)
+            # Wall-clock time, as entries are compared across restarts
+            entry = None if row is None or time.time() - row[2] >= self.ttl else self._entry(row)
+        except (sqlite3.Error, OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"LinkedIn cache read failed for {url}: {e}")
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def get_many(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get unexpired cached company data for several URLs in one query"""
+        try:
+            rows = await asyncio.to_thread(self._select_many, urls)
+            cutoff = time.time() - self.ttl
+            found = {row[0]: self._entry(row[1:]) for row in rows if row[3] > cutoff}
+        except (sqlite3.Error, OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"LinkedIn cache read failed for {len(urls)} URLs: {e}")
+            found = {}
+        self.hits += len(found)
+        self.misses += len(urls) - len(found)
+        return found
+
+    @staticmethod
+    def _entry(row: tuple) -> Dict[str, Any]:
+        return {
+            "company_data": orjson.loads(row[0]),
+            "raw_data": orjson.loads(row[1]),
+            "fetched_at": row[2]
+        }
+
+    async def put(
+        self,
+        url: str,
+        company_data: Dict[str, Any],
+        raw_data: Dict[str, Any]
+    ) -> None:
+        """Store company data for a URL"""
+        await self.put_many([(url, company_data, raw_data)])
+
+    async def put_many(self, entries: List[tuple]) -> None:
+        """Store (url, company_data, raw_data) entries in one transaction"""
+        now = time.time()
+        rows = [
+            (url, orjson.dumps(company_data, default=str), orjson.dumps(raw_data, default=str), now)
+            for url, company_data, raw_data in entries
+        ]
+        try:
+            await asyncio.to_thread(self._upsert, rows)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"LinkedIn cache write failed for {len(rows)} entries: {e}")
+
+    async def clear(self, url: Optional[str] = None) -> None:
+        """Drop one URL, or every entry when no URL is given"""
+        await asyncio.to_thread(self._delete, url)
+
+    def stats(self) -> Dict[str, int]:
+        return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+
+@lru_cache(maxsize=1)
+def get_linkedin_cache() -> LinkedInCache:
+    """Get persistent cache of LinkedIn company data"""
+    config = get_config()
+    return LinkedInCache(
+        path=os.path.join(os.path.expanduser(config.CACHE_DIR), "apify_cache.db"),
+        ttl=config.CACHE_LINKEDIN_DATA_DAYS * 86400
+    )
+
+
+class LLMResponseCache:
+    """TTL cache of successful LLM responses keyed by request hash
+
+    Scoring and thesis prompts run at low temperature, so an identical
+    request returns an equivalent answer and can skip the Bedrock call.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(**request: Any) -> bytes:
+        """Hash the canonicalised request parameters"""
+        return hashlib.blake2b(
+            orjson.dumps(request, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        result = self._cache.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, key: bytes, result: Dict[str, Any]) -> None:
+        self._cache[key] = result
+
+    def stats(self) -> Dict[str, int]:
+        return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+
+@lru_cache(maxsize=1)
+def get_llm_response_cache() -> LLMResponseCache:
+    """Get cache of Bedrock responses"""
+    return LLMResponseCache(maxsize=1024, ttl=get_config().CACHE_LLM_RESPONSE_SECONDS)
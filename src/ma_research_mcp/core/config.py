@@ -3,15 +3,28 @@ Configuration management for M&A Research Assistant
 """
 
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field, ConfigDict
+import sys
+import threading
+from functools import cached_property
+from typing import Any, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator, model_validator
+
+_SIZE_UNITS = {"GB": 1024 ** 3, "MB": 1024 ** 2, "KB": 1024, "B": 1}
 
 
 class Config(BaseSettings):
     """Application configuration"""
     
-    model_config = ConfigDict(env_file=".env", case_sensitive=True)
+    # Defaults below are literals of the annotated type, so skip re-validating
+    # them on every load; values read from the environment are still validated.
+    # Frozen: the shared instance is read by every service and must not drift.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        validate_default=False,
+        frozen=True
+    )
     
     # AWS Configuration
     AWS_ACCESS_KEY_ID: str = Field(...)
@@ -23,6 +36,10 @@ class Config(BaseSettings):
     BEDROCK_REGION: str = Field("us-east-1")
     BEDROCK_PRIMARY_MODEL: str = Field("anthropic.claude-3-5-sonnet-20241022-v2:0")
     BEDROCK_FALLBACK_MODEL: str = Field("amazon.nova-pro-v1:0")
+    # Inference profile or provisioned throughput ARNs; when set they are sent
+    # as modelId in place of the on-demand model IDs above
+    BEDROCK_PRIMARY_MODEL_ARN: Optional[str] = Field(None)
+    BEDROCK_FALLBACK_MODEL_ARN: Optional[str] = Field(None)
     
     # API Keys
     APIFY_API_TOKEN: str = Field(...)
@@ -47,13 +64,14 @@ class Config(BaseSettings):
     BEDROCK_MAX_CONCURRENT: int = Field(10)
     
     APIFY_REQUESTS_PER_HOUR: int = Field(100)
+    APIFY_MAX_CONCURRENT_RUNS: int = Field(4)
     
     WEB_SCRAPING_REQUESTS_PER_SECOND: int = Field(1)
     WEB_SCRAPING_CONCURRENT_DOMAINS: int = Field(5)
     
     # Resource Limits
-    MAX_MEMORY_PER_ANALYSIS: str = Field("512MB")
-    MAX_WEBSITE_CONTENT_SIZE: str = Field("10MB")
+    MAX_MEMORY_PER_ANALYSIS: int = Field(512 * 1024 ** 2)  # bytes; env accepts "512MB"
+    MAX_WEBSITE_CONTENT_SIZE: int = Field(10 * 1024 ** 2)  # bytes; env accepts "10MB"
     MAX_PAGES_PER_COMPANY: int = Field(10)
     MAX_ANALYSIS_TIME: int = Field(300)
     MAX_RETRY_ATTEMPTS: int = Field(3)
@@ -62,27 +80,66 @@ class Config(BaseSettings):
     CACHE_WEBSITE_CONTENT_HOURS: int = Field(24)
     CACHE_LINKEDIN_DATA_DAYS: int = Field(7)
     CACHE_PAID_API_DAYS: int = Field(30)
+    CACHE_ANALYSIS_SECONDS: int = Field(300)
+    CACHE_LLM_RESPONSE_SECONDS: int = Field(3600)
+    CACHE_DIR: str = Field("~/.ma_research_mcp")
     
     # Security
     ENCRYPT_SENSITIVE_DATA: bool = Field(True)
     AUDIT_ALL_OPERATIONS: bool = Field(True)
     REQUIRE_MFA_FOR_EXPORTS: bool = Field(True)
 
+    @cached_property
+    def bedrock_request_interval_s(self) -> float:
+        """Seconds per Bedrock request at the configured rate limit"""
+        return 60.0 / self.BEDROCK_REQUESTS_PER_MINUTE
+
+    @cached_property
+    def bedrock_token_interval_s(self) -> float:
+        """Seconds per Bedrock token at the configured rate limit"""
+        return 60.0 / self.BEDROCK_TOKENS_PER_MINUTE
+
+    @field_validator("MAX_MEMORY_PER_ANALYSIS", "MAX_WEBSITE_CONTENT_SIZE", mode="before")
+    @classmethod
+    def _parse_size(cls, value: Any) -> Any:
+        """Parse size strings like '10MB' to bytes"""
+        if not isinstance(value, str):
+            return value
+        size_str = value.strip().upper()
+        for unit, multiplier in _SIZE_UNITS.items():
+            if size_str.endswith(unit):
+                return int(size_str[:-len(unit)]) * multiplier
+        return int(size_str)
+
+    @model_validator(mode="after")
+    def _intern_strings(self) -> "Config":
+        """Intern string settings that are passed into every client call"""
+        for name, value in self.__dict__.items():
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
+        return self
+
 
 # Global configuration instance
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
     """Get global configuration instance"""
     global _config
+    # Double-checked so concurrent first calls build a single Config without
+    # taking the lock once it exists
     if _config is None:
-        _config = Config()
+        with _config_lock:
+            if _config is None:
+                _config = Config()
     return _config
 
 
 def reload_config() -> Config:
     """Reload configuration from environment"""
     global _config
-    _config = Config()
-    return _config
\ No newline at end of file
+    with _config_lock:
+        _config = Config()
+    return _config
@@ -0,0 +1,16 @@
+"""
+Identifier generation for M&A Research Assistant
+"""
+
+import itertools
+import time
+
+# Fixed per process; the counter keeps IDs unique within it, even when several
+# are created in the same second by bulk or concurrent requests
+_PROCESS_PREFIX = f"{time.time_ns():x}"
+_counter = itertools.count()
+
+
+def generate_id(prefix: str) -> str:
+    """Generate a unique identifier such as 'export_17f3a9c2b1d4e000_2a'"""
+    return f"{prefix}_{_PROCESS_PREFIX}_{next(_counter):x}"
@@ -2,72 +2,201 @@
 Logging configuration for M&A Research Assistant
 """
 
+import atexit
 import logging
 import logging.config
+import os
+import queue
 import sys
-from typing import Dict, Any
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Any, Optional
+
+DETAILED_FORMAT = "{asctime} [{levelname}] {name}:{lineno}: {message}"
+AUDIT_FORMAT = "{asctime} [AUDIT] {message}"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Records are handed to a background thread so that log calls made from the
+# event loop never block on disk I/O
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_listener: Optional[QueueListener] = None
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that checks the file size periodically
+
+    The stock handler re-formats every record and seeks to the end of the
+    file on each emit to decide whether to roll over. Here a running byte
+    estimate is kept and the file is only consulted every CHECK_INTERVAL
+    records, or sooner when the estimate approaches maxBytes.
+
+    Writes go through a ``buffering``-sized buffer that is flushed at most
+    once per ``flush_interval`` seconds rather than after every record.
+    """
+
+    CHECK_INTERVAL = 256
+
+    def __init__(
+        self,
+        *args: Any,
+        buffering: int = 65536,
+        flush_interval: float = 1.0,
+        **kwargs: Any
+    ) -> None:
+        # Set before the base initializer, which opens the stream
+        self.buffering = buffering
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
+        self._records_since_check = 0
+        self._bytes_since_check = 0
+        self._size_at_check = (
+            os.path.getsize(self.baseFilename) if os.path.isfile(self.baseFilename) else 0
+        )
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.maxBytes <= 0:
+            return False
+
+        self._records_since_check += 1
+        self._bytes_since_check += len(record.getMessage())
+        if (
+            self._records_since_check < self.CHECK_INTERVAL
+            and self._size_at_check + self._bytes_since_check < self.maxBytes * 0.9
+        ):
+            return False
+
+        self._records_since_check = 0
+        self._bytes_since_check = 0
+        if super().shouldRollover(record):
+            self._size_at_check = 0
+            return True
+
+        # The base check leaves the stream positioned at end of file
+        self._size_at_check = self.stream.tell() if self.stream else 0
+        return False
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffering,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+
+    def flush(self) -> None:
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            super().flush()
+            self._last_flush = now
+
+
+class FlushingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers when the queue goes idle
+
+    Bounds how long buffered records can sit unwritten when logging stops.
+    """
+
+    def __init__(self, *args: Any, flush_interval: float = 1.0, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
+def _create_queue_handler() -> QueueHandler:
+    """Create handler that enqueues records for the listener thread"""
+    return QueueHandler(_log_queue)
 
 
 def setup_logging(log_level: str = "INFO") -> None:
     """Setup application logging configuration"""
-    
+    global _queue_listener
+
+    # Already configured: a second listener would open the same files again
+    # and race the first one for records
+    if _queue_listener is not None:
+        logging.getLogger().setLevel(log_level)
+        return
+
+    # Thread/process names are never formatted; skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Check if running as MCP server (STDIO mode)
-    import os
     is_mcp_mode = os.getenv("MCP_MODE", "false").lower() == "true" or not sys.stdout.isatty()
-    
+
     config: Dict[str, Any] = {
         "version": 1,
         "disable_existing_loggers": False,
-        "formatters": {
-            "standard": {
-                "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S"
-            },
-            "detailed": {
-                "format": "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d: %(message)s",
-                "datefmt": "%Y-%m-%d %H:%M:%S"
-            }
-        },
         "handlers": {
-            "file": {
-                "class": "logging.handlers.RotatingFileHandler",
-                "level": "DEBUG",
-                "formatter": "detailed",
-                "filename": "ma_research.log",
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5
+            "queue": {
+                "()": _create_queue_handler,
+                "level": "DEBUG"
             }
         },
         "loggers": {
             "ma_research_mcp": {
                 "level": "DEBUG",
-                "handlers": ["file"],
+                "handlers": ["queue"],
                 "propagate": False
             },
             "botocore": {
                 "level": "WARNING",
-                "handlers": ["file"],
+                "handlers": ["queue"],
                 "propagate": False
             },
             "urllib3": {
                 "level": "WARNING",
-                "handlers": ["file"],
+                "handlers": ["queue"],
                 "propagate": False
             }
         },
         "root": {
             "level": log_level,
-            "handlers": ["file"]
+            "handlers": ["queue"]
         }
     }
-    
+
     logging.config.dictConfig(config)
-    
-    # Set up structured logging for audit trail
+
+    file_handler = FastRotatingFileHandler(
+        "ma_research.log",
+        maxBytes=10485760,  # 10MB
+        backupCount=5
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(logging.Formatter(DETAILED_FORMAT, DATE_FORMAT, style="{"))
+
+    # Set up structured logging for audit trail. Audit records propagate to
+    # the queue like any other record; the filter keeps audit.log to them only.
     audit_logger = logging.getLogger("ma_research_mcp.audit")
-    audit_handler = logging.FileHandler("audit.log")
-    audit_handler.setFormatter(
-        logging.Formatter("%(asctime)s [AUDIT] %(message)s")
+    # Flushed on every record: the audit trail must survive a crash intact
+    audit_handler = FastRotatingFileHandler(
+        "audit.log",
+        maxBytes=10485760,  # 10MB
+        backupCount=5,
+        buffering=-1,
+        flush_interval=0
+    )
+    audit_formatter = logging.Formatter(AUDIT_FORMAT, style="{")
+    audit_formatter.default_msec_format = None
+    audit_handler.setFormatter(audit_formatter)
+    audit_handler.addFilter(logging.Filter("ma_research_mcp.audit"))
+    audit_logger.setLevel(logging.INFO)
+
+    _queue_listener = FlushingQueueListener(
+        _log_queue, file_handler, audit_handler, respect_handler_level=True
     )
-    audit_logger.addHandler(audit_handler)
-    audit_logger.setLevel(logging.INFO)
\ No newline at end of file
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
@@ -0,0 +1,47 @@
+"""
+Async rate limiting for M&A Research Assistant
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket holding up to ``capacity`` tokens
+
+    One token is added every ``interval`` seconds. Waiters sleep outside the
+    lock, so one caller waiting for a refill does not block the others from
+    checking the bucket.
+    """
+
+    def __init__(self, capacity: float, interval: float) -> None:
+        self.capacity = capacity
+        self.interval = interval
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) / self.interval)
+        self.last_refill = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens are available and take them"""
+        amount = min(amount, self.capacity)
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) * self.interval
+            await asyncio.sleep(wait)
+
+    def charge(self, amount: float) -> None:
+        """Take tokens without waiting, e.g. once actual usage is known
+
+        The balance may go negative, which makes later callers wait.
+        """
+        self._refill()
+        self.tokens -= amount
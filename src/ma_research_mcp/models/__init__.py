@@ -2,13 +2,31 @@
 Data models for M&A Research Assistant
 """
 
-from .analysis import *
-from .company import *
-from .scoring import *
+from .analysis import (
+    AnalysisMetadata,
+    AnalysisResult,
+    DimensionScoreResponse,
+    ExportMetadata,
+    FilterCriteria,
+    FilteringResult,
+    InvestmentThesis,
+    LikelihoodFactors,
+    NurturingPlan,
+    OverrideMetadata,
+    QualificationResult,
+    ScoreDimension,
+)
+from .company import CompanyList, CompanyMetadata
+from .scoring import (
+    DEFAULT_SCORING_DIMENSIONS,
+    ScoringDimension,
+    ScoringSystem,
+    ScoringSystemResult,
+)
 
 __all__ = [
     "AnalysisResult",
-    "AnalysisMetadata", 
+    "AnalysisMetadata",
     "ExportMetadata",
     "CompanyList",
     "CompanyMetadata",
@@ -16,10 +34,13 @@ __all__ = [
     "ScoringDimension",
     "ScoringSystemResult",
     "ScoreDimension",
+    "DimensionScoreResponse",
     "QualificationResult",
     "OverrideMetadata",
     "InvestmentThesis",
     "NurturingPlan",
     "LikelihoodFactors",
-    "FilteringResult"
-]
\ No newline at end of file
+    "FilteringResult",
+    "FilterCriteria",
+    "DEFAULT_SCORING_DIMENSIONS"
+]
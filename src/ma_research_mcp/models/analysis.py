@@ -4,7 +4,7 @@ Analysis-related data models
 
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AnalysisMetadata(BaseModel):
@@ -17,8 +17,8 @@ class AnalysisMetadata(BaseModel):
     apify_requests_made: int
     pages_scraped: int
     data_sources_used: List[str]
-    errors_encountered: List[str] = []
-    warnings: List[str] = []
+    errors_encountered: List[str] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
     cost_estimate_usd: float = 0.0
 
 
@@ -35,6 +35,8 @@ class ExportMetadata(BaseModel):
 
 class ScoreDimension(BaseModel):
     """Individual dimension score"""
+    model_config = ConfigDict(frozen=True)
+
     dimension_name: str
     score: float
     confidence: float
@@ -43,6 +45,15 @@ class ScoreDimension(BaseModel):
     data_sources: List[str]
 
 
+class DimensionScoreResponse(BaseModel):
+    """Dimension score as returned by the LLM"""
+    score: float
+    confidence: float = 0.0
+    evidence: List[str] = Field(default_factory=list)
+    reasoning: str = ""
+    data_sources: List[str] = Field(default_factory=list)
+
+
 class QualificationResult(BaseModel):
     """Lead qualification results"""
     is_qualified: bool
@@ -73,6 +84,16 @@ class FilteringResult(BaseModel):
     company_age_years: Optional[int] = None
 
 
+class FilterCriteria(BaseModel):
+    """Criteria for bulk filtering of analyzed companies"""
+    model_config = ConfigDict(frozen=True)
+
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    tier: Optional[str] = None
+    qualified: Optional[bool] = None
+
+
 class OverrideMetadata(BaseModel):
     """Tier override metadata"""
     override_by: str
@@ -112,6 +133,8 @@ class NurturingPlan(BaseModel):
 
 class LikelihoodFactors(BaseModel):
     """Likelihood assessment factors"""
+    model_config = ConfigDict(frozen=True)
+
     market_position: Optional[str] = None
     competitive_landscape: Optional[str] = None
     team_quality: Optional[str] = None
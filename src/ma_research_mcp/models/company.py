@@ -22,12 +22,12 @@ class CompanyMetadata(BaseModel):
     primary_business_model: Optional[str] = None
     target_market: Optional[str] = None
     primary_product: Optional[str] = None
-    key_executives: List[Dict[str, str]] = []
-    competitors: List[str] = []
-    technology_stack: List[str] = []
-    certifications: List[str] = []
-    partnerships: List[str] = []
-    awards: List[str] = []
+    key_executives: List[Dict[str, str]] = Field(default_factory=list)
+    competitors: List[str] = Field(default_factory=list)
+    technology_stack: List[str] = Field(default_factory=list)
+    certifications: List[str] = Field(default_factory=list)
+    partnerships: List[str] = Field(default_factory=list)
+    awards: List[str] = Field(default_factory=list)
 
 
 class CompanyList(BaseModel):
@@ -47,11 +47,11 @@ class CompanyList(BaseModel):
     
     # Monitoring configuration
     monitoring_frequency: str  # "weekly", "monthly", "quarterly"
-    alert_thresholds: Dict[str, float] = {}
+    alert_thresholds: Dict[str, float] = Field(default_factory=dict)
     
     # Promotion tracking
     promotion_criteria_met: bool = False
-    promotion_blockers: List[str] = []
+    promotion_blockers: List[str] = Field(default_factory=list)
     
     # Engagement tracking
     last_contact_date: Optional[str] = None
@@ -60,10 +60,10 @@ class CompanyList(BaseModel):
     contact_frequency_days: int = 30
     
     # Notes and history
-    notes: List[Dict[str, Any]] = []
-    status_history: List[Dict[str, Any]] = []
+    notes: List[Dict[str, Any]] = Field(default_factory=list)
+    status_history: List[Dict[str, Any]] = Field(default_factory=list)
     
     # Performance metrics
     total_analyses: int = 0
-    score_trend: List[float] = []
+    score_trend: List[float] = Field(default_factory=list)
     last_analysis_date: Optional[str] = None
\ No newline at end of file
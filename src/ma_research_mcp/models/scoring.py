@@ -3,11 +3,15 @@ Scoring system data models
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from .analysis import ScoreDimension
 
 
 class ScoringDimension(BaseModel):
     """Individual scoring dimension configuration"""
+    model_config = ConfigDict(frozen=True)
+
     dimension_id: str
     dimension_name: str
     description: str
@@ -16,12 +20,14 @@ class ScoringDimension(BaseModel):
     max_score: float = 10.0
     scoring_criteria: Dict[str, Any]
     prompt_template: str
-    evaluation_examples: List[Dict[str, Any]] = []
+    evaluation_examples: List[Dict[str, Any]] = Field(default_factory=list)
     is_required: bool = True
 
 
 class ScoringSystem(BaseModel):
     """Complete scoring system configuration"""
+    model_config = ConfigDict(frozen=True)
+
     system_id: str
     system_name: str
     description: str
@@ -37,25 +43,27 @@ class ScoringSystem(BaseModel):
     thresholds: Dict[str, float]  # tier_name -> min_score
     
     # Customization
-    custom_prompts: Dict[str, str] = {}
-    custom_rules: Dict[str, Any] = {}
-    preprocessing_rules: List[str] = []
-    postprocessing_rules: List[str] = []
+    custom_prompts: Dict[str, str] = Field(default_factory=dict)
+    custom_rules: Dict[str, Any] = Field(default_factory=dict)
+    preprocessing_rules: List[str] = Field(default_factory=list)
+    postprocessing_rules: List[str] = Field(default_factory=list)
     
     # Metadata
     version: str = "1.0"
-    tags: List[str] = []
-    usage_stats: Dict[str, int] = {}
+    tags: List[str] = Field(default_factory=list)
+    usage_stats: Dict[str, int] = Field(default_factory=dict)
 
 
 class ScoringSystemResult(BaseModel):
     """Results from a specific scoring system"""
+    model_config = ConfigDict(frozen=True)
+
     system_id: str
     system_name: str
     execution_timestamp: str
     
     # Individual dimension scores
-    dimension_scores: Dict[str, "ScoreDimension"]
+    dimension_scores: Dict[str, ScoreDimension]
     
     # Overall results
     weighted_score: float
@@ -71,7 +79,7 @@ class ScoringSystemResult(BaseModel):
     execution_time_seconds: float
     tokens_used: int
     api_calls_made: int
-    errors: List[str] = []
+    errors: List[str] = Field(default_factory=list)
 
 
 # Default scoring system dimensions
@@ -2,14 +2,31 @@
 Services module for M&A Research Assistant
 """
 
-from .s3_service import S3Service
-from .bedrock_service import BedrockLLMService
-from .web_scraper import WebScrapingService
-from .apify_service import ApifyService
-
-__all__ = [
-    "S3Service",
-    "BedrockLLMService", 
-    "WebScrapingService",
-    "ApifyService"
-]
\ No newline at end of file
+import importlib
+from typing import Any
+
+# Imported on first use (PEP 562) so that a tool needing only S3 does not
+# also load the Bedrock, Apify and scraping clients
+_SERVICE_MODULES = {
+    "S3Service": ".s3_service",
+    "get_s3_service": ".s3_service",
+    "BedrockLLMService": ".bedrock_service",
+    "get_bedrock_service": ".bedrock_service",
+    "WebScrapingService": ".web_scraper",
+    "ApifyService": ".apify_service"
+}
+
+__all__ = list(_SERVICE_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -4,16 +4,118 @@ Apify API service for LinkedIn company data extraction
 
 import asyncio
 import logging
+import random
+import re
 import time
+from collections import deque
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import aiohttp
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
+from ..core.cache import get_linkedin_cache
 from ..core.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Numbers in LinkedIn company sizes, e.g. "1,001-5,000 employees"
+_EMPLOYEE_COUNT_RE = re.compile(r'[\d,]+')
+
+@lru_cache(maxsize=64)
+def _employee_count_from_size(company_size: str) -> Optional[int]:
+    """Parse employee count from a LinkedIn company size string
+
+    LinkedIn uses a handful of fixed size bands, so results are memoized.
+    """
+    # Common patterns: "51-200 employees", "1,001-5,000 employees"
+    if 'employee' not in company_size.lower():
+        return None
+    
+    # Take the first number as rough estimate
+    numbers = _EMPLOYEE_COUNT_RE.findall(company_size)
+    if not numbers:
+        return None
+    try:
+        return int(numbers[0].replace(',', ''))
+    except ValueError:
+        return None
+
+
+def _normalize_linkedin_url(url: str) -> str:
+    """Reduce a LinkedIn URL to a comparable form
+
+    The actor may echo a requested URL with another scheme, a "www." prefix,
+    a query string or a trailing slash.
+    """
+    url = url.strip().lower().split('#', 1)[0].split('?', 1)[0]
+    url = re.sub(r'^https?://', '', url)
+    if url.startswith('www.'):
+        url = url[4:]
+    return url.rstrip('/')
+
+
+# Request bodies are pre-encoded with orjson, so their type is set explicitly
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Statuses worth retrying; anything else (401, 400, 404, ...) fails at once
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_AFTER = 60.0
+
+# Longest run Apify's synchronous run endpoints wait for
+_SYNC_RUN_MAX_SECS = 300
+
+
+class TransientApifyError(Exception):
+    """Apify request failed in a way that may succeed on retry"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after(headers: Any) -> Optional[float]:
+    """Parse a Retry-After header given in seconds"""
+    try:
+        return min(float(headers.get('Retry-After', '')), _MAX_RETRY_AFTER)
+    except ValueError:
+        return None
+
+
+_backoff = wait_exponential_jitter(initial=4, max=10)
+
+
+def _wait_for_retry(retry_state: Any) -> float:
+    """Wait as long as the server's Retry-After asks, else back off exponentially"""
+    retry_after = getattr(retry_state.outcome.exception(), 'retry_after', None)
+    if retry_after is not None:
+        return retry_after
+    return _backoff(retry_state)
+
+
+# Data quality: core fields count 1, extras 0.5; the score is normalised by
+# the six core fields plus two for the extras
+_QUALITY_WEIGHTS = (
+    ('company_name', 1.0),
+    ('description', 1.0),
+    ('industry', 1.0),
+    ('company_size', 1.0),
+    ('headquarters', 1.0),
+    ('website', 1.0),
+    ('founded', 0.5),
+    ('specialties', 0.5),
+    ('employee_count', 0.5),
+    ('recent_updates', 0.5),
+)
+_QUALITY_TOTAL = 8.0
+
 
 class ApifyService:
     """Apify API service for LinkedIn company data"""
@@ -28,21 +130,50 @@ class ApifyService:
         self.timeout_secs = 300
         self.memory_mbytes = 256
         self.max_retries = 3
+        self.run_options = {
+            'timeout': self.timeout_secs,
+            'memory': self.memory_mbytes,
+            'build': 'latest'
+        }
+        self._run_options_body = orjson.dumps(self.run_options)
+        self._sync_run_params = {**self.run_options, 'clean': 'true', 'format': 'json'}
+        self.batch_chunk_size = 10  # URLs per actor run in batch lookups
         
-        # Rate limiting
+        # Rate limiting: token bucket holding up to an hour's budget, so
+        # bursts go through immediately while the long-run rate stays capped
         self.requests_per_hour = self.config.APIFY_REQUESTS_PER_HOUR
+        self._refill_rate = self.requests_per_hour / 3600
+        self._tokens = float(self.requests_per_hour)
+        self._last_refill = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        # Start times of requests in the trailing hour, enforcing the hard
+        # hourly cap that a full bucket plus its refill could otherwise exceed
+        self._request_times: deque = deque()
+        # Caps actor runs in flight; extra callers queue here instead of
+        # holding connections and rate-limit waits
+        self._run_semaphore = asyncio.Semaphore(self.config.APIFY_MAX_CONCURRENT_RUNS)
         self.last_request_time = 0
         self.request_count = 0
-        self.hour_start = time.time()
         
         self.session = None
+        self.cache = get_linkedin_cache()
         
         logger.info("Initialized Apify service")
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self.session is None or self.session.closed:
+            # Keep idle connections to api.apify.com open between status polls
+            # so each request does not pay a fresh TCP + TLS handshake
+            connector = aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=10,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
             self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Authorization': f'Bearer {self.api_token}'},
                 timeout=aiohttp.ClientTimeout(total=600)  # 10 minutes for runs
             )
         return self.session
@@ -54,91 +185,145 @@ class ApifyService:
     
     async def _check_rate_limits(self) -> None:
         """Check and enforce rate limits"""
-        current_time = time.time()
-        
-        # Reset counter every hour
-        if current_time - self.hour_start >= 3600:
-            self.request_count = 0
-            self.hour_start = current_time
-        
-        # Check if we've hit the hourly limit
-        if self.request_count >= self.requests_per_hour:
-            sleep_time = 3600 - (current_time - self.hour_start)
-            if sleep_time > 0:
+        async with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.requests_per_hour,
+                self._tokens + (now - self._last_refill) * self._refill_rate
+            )
+            self._last_refill = now
+            
+            if self._tokens < 1:
+                sleep_time = (1 - self._tokens) / self._refill_rate
                 logger.warning(f"Apify rate limit hit, sleeping {sleep_time:.1f}s")
                 await asyncio.sleep(sleep_time)
-                self.request_count = 0
-                self.hour_start = time.time()
-        
-        # Minimum time between requests (1 request per minute for safety)
-        if current_time - self.last_request_time < 60:
-            sleep_time = 60 - (current_time - self.last_request_time)
-            await asyncio.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-        self.request_count += 1
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+            
+            now = time.monotonic()
+            while self._request_times and self._request_times[0] <= now - 3600:
+                self._request_times.popleft()
+            
+            if len(self._request_times) >= self.requests_per_hour:
+                sleep_time = 3600 - (now - self._request_times[0])
+                logger.warning(f"Apify hourly limit hit, sleeping {sleep_time:.1f}s")
+                await asyncio.sleep(sleep_time)
+                self._request_times.popleft()
+            
+            self._tokens -= 1
+            self._request_times.append(time.monotonic())
+            self.last_request_time = time.time()
+            self.request_count += 1
     
     @retry(
+        retry=retry_if_exception_type(TransientApifyError),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
+        wait=_wait_for_retry,
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
     )
     async def _run_actor(
         self,
         actor_id: str,
         input_data: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[List[Dict[str, Any]]]:
         """Run Apify actor and wait for completion"""
         try:
-            await self._check_rate_limits()
-            
-            session = await self._get_session()
-            
-            # Start actor run
-            run_url = f"{self.base_url}/acts/{actor_id}/runs"
-            headers = {
-                'Authorization': f'Bearer {self.api_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            run_data = {
-                'timeout': self.timeout_secs,
-                'memory': self.memory_mbytes,
-                'build': 'latest'
-            }
-            
-            logger.info(f"Starting Apify actor run: {actor_id}")
-            
-            async with session.post(run_url, json=run_data, headers=headers) as response:
-                if response.status != 201:
-                    error_text = await response.text()
-                    logger.error(f"Failed to start actor run: {response.status} - {error_text}")
-                    return None
+            async with self._run_semaphore:
+                await self._check_rate_limits()
                 
-                run_info = await response.json()
-                run_id = run_info['data']['id']
-            
-            # Set input data
-            input_url = f"{self.base_url}/actor-runs/{run_id}/input"
-            async with session.put(input_url, json=input_data, headers=headers) as response:
-                if response.status not in [200, 201]:
-                    logger.error(f"Failed to set input data: {response.status}")
-                    return None
-            
-            # Wait for completion
-            logger.info(f"Waiting for actor run {run_id} to complete...")
-            result = await self._wait_for_completion(run_id)
-            
-            if result:
-                logger.info(f"Actor run {run_id} completed successfully")
-                return result
-            else:
-                logger.error(f"Actor run {run_id} failed or timed out")
-                return None
+                session = await self._get_session()
+                logger.info(f"Starting Apify actor run: {actor_id}")
                 
+                # A run that fits the synchronous endpoint's limit is started,
+                # awaited and its dataset returned in a single request
+                if self.timeout_secs <= _SYNC_RUN_MAX_SECS:
+                    return await self._run_actor_sync(session, actor_id, input_data)
+                return await self._run_actor_async(session, actor_id, input_data)
+                
+        except TransientApifyError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise TransientApifyError(f"Error running Apify actor {actor_id}: {e}") from e
         except Exception as e:
             logger.error(f"Error running Apify actor {actor_id}: {e}")
             return None
     
+    async def _run_actor_sync(
+        self,
+        session: aiohttp.ClientSession,
+        actor_id: str,
+        input_data: Dict[str, Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Run actor via run-sync-get-dataset-items and return its dataset items"""
+        run_url = f"{self.base_url}/acts/{actor_id}/run-sync-get-dataset-items"
+        async with session.post(
+            run_url,
+            params=self._sync_run_params,
+            data=orjson.dumps(input_data),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status not in [200, 201]:
+                error_text = await response.text()
+                if response.status in _TRANSIENT_STATUSES:
+                    raise TransientApifyError(
+                        f"Actor run failed: {response.status} - {error_text}",
+                        _retry_after(response.headers)
+                    )
+                logger.error(f"Actor run failed: {response.status} - {error_text}")
+                return None
+            
+            results = orjson.loads(await response.read())
+        
+        logger.info(f"Actor run {actor_id} completed successfully")
+        return results if isinstance(results, list) else [results]
+    
+    async def _run_actor_async(
+        self,
+        session: aiohttp.ClientSession,
+        actor_id: str,
+        input_data: Dict[str, Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Start actor run, then poll until it finishes and fetch its results"""
+        # Start actor run
+        run_url = f"{self.base_url}/acts/{actor_id}/runs"
+        async with session.post(run_url, data=self._run_options_body, headers=_JSON_HEADERS) as response:
+            if response.status != 201:
+                error_text = await response.text()
+                if response.status in _TRANSIENT_STATUSES:
+                    raise TransientApifyError(
+                        f"Failed to start actor run: {response.status} - {error_text}",
+                        _retry_after(response.headers)
+                    )
+                logger.error(f"Failed to start actor run: {response.status} - {error_text}")
+                return None
+            
+            run_info = orjson.loads(await response.read())
+            run_id = run_info['data']['id']
+        
+        # Set input data
+        input_url = f"{self.base_url}/actor-runs/{run_id}/input"
+        async with session.put(input_url, data=orjson.dumps(input_data), headers=_JSON_HEADERS) as response:
+            if response.status not in [200, 201]:
+                if response.status in _TRANSIENT_STATUSES:
+                    raise TransientApifyError(
+                        f"Failed to set input data: {response.status}",
+                        _retry_after(response.headers)
+                    )
+                logger.error(f"Failed to set input data: {response.status}")
+                return None
+        
+        # Wait for completion
+        logger.info(f"Waiting for actor run {run_id} to complete...")
+        result = await self._wait_for_completion(run_id)
+        
+        if result:
+            logger.info(f"Actor run {run_id} completed successfully")
+            return result
+        else:
+            logger.error(f"Actor run {run_id} failed or timed out")
+            return None
+    
     async def _wait_for_completion(
         self,
         run_id: str,
@@ -147,33 +332,43 @@ class ApifyService:
         """Wait for actor run to complete and return results"""
         try:
             session = await self._get_session()
-            headers = {'Authorization': f'Bearer {self.api_token}'}
-            
-            start_time = time.time()
-            
-            while time.time() - start_time < max_wait_time:
-                # Check run status
+            start_time = time.monotonic()
+            # Backoff between polls that the server answered without holding
+            delay = 1.0
+            
+            while time.monotonic() - start_time < max_wait_time:
+                # Long-poll: Apify holds the request until the run finishes or
+                # waitForFinish (at most 60s) elapses, so no client-side sleep
+                remaining = max_wait_time - (time.monotonic() - start_time)
+                params = {'waitForFinish': max(1, min(60, int(remaining)))}
                 status_url = f"{self.base_url}/actor-runs/{run_id}"
-                async with session.get(status_url, headers=headers) as response:
+                poll_started = time.monotonic()
+                async with session.get(status_url, params=params) as response:
                     if response.status != 200:
                         logger.error(f"Failed to get run status: {response.status}")
                         return None
                     
-                    run_info = await response.json()
+                    run_info = orjson.loads(await response.read())
                     status = run_info['data']['status']
                     
                     if status == 'SUCCEEDED':
                         # Get results
-                        return await self._get_run_results(run_id)
+                        return await self._get_run_results(
+                            run_id, run_info['data'].get('defaultDatasetId')
+                        )
                     elif status in ['FAILED', 'ABORTED', 'TIMED-OUT']:
                         logger.error(f"Actor run {run_id} failed with status: {status}")
                         return None
                     elif status in ['READY', 'RUNNING']:
-                        # Still running, wait and check again
-                        await asyncio.sleep(10)
+                        # Long-poll expired with the run still going; poll again
+                        # at once unless the server returned early
+                        if time.monotonic() - poll_started >= params['waitForFinish']:
+                            continue
                     else:
                         logger.warning(f"Unknown run status: {status}")
-                        await asyncio.sleep(10)
+                
+                await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+                delay = min(delay * 1.6, 15.0)
             
             logger.error(f"Actor run {run_id} timed out after {max_wait_time}s")
             return None
@@ -182,30 +377,35 @@ class ApifyService:
             logger.error(f"Error waiting for actor run {run_id}: {e}")
             return None
     
-    async def _get_run_results(self, run_id: str) -> Optional[List[Dict[str, Any]]]:
+    async def _get_run_results(
+        self,
+        run_id: str,
+        dataset_id: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
         """Get results from completed actor run"""
         try:
             session = await self._get_session()
-            headers = {'Authorization': f'Bearer {self.api_token}'}
-            
-            # Get dataset ID
-            run_url = f"{self.base_url}/actor-runs/{run_id}"
-            async with session.get(run_url, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to get run info: {response.status}")
-                    return None
-                
-                run_info = await response.json()
-                dataset_id = run_info['data']['defaultDatasetId']
+            # Get dataset ID, unless the caller already has it from the run info
+            if dataset_id is None:
+                run_url = f"{self.base_url}/actor-runs/{run_id}"
+                async with session.get(run_url) as response:
+                    if response.status != 200:
+                        logger.error(f"Failed to get run info: {response.status}")
+                        return None
+                    
+                    run_info = orjson.loads(await response.read())
+                    dataset_id = run_info['data']['defaultDatasetId']
             
             # Get dataset items
+            # clean=true drops empty items and hidden "#" fields server-side
             dataset_url = f"{self.base_url}/datasets/{dataset_id}/items"
-            async with session.get(dataset_url, headers=headers) as response:
+            params = {'clean': 'true', 'format': 'json'}
+            async with session.get(dataset_url, params=params) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get dataset items: {response.status}")
                     return None
                 
-                results = await response.json()
+                results = orjson.loads(await response.read())
                 return results if isinstance(results, list) else [results]
                 
         except Exception as e:
@@ -221,6 +421,18 @@ class ApifyService:
         try:
             logger.info(f"Fetching LinkedIn data for: {linkedin_url}")
             
+            if self.config.ENABLE_CACHING and not force_refresh:
+                cached = await self.cache.get(linkedin_url)
+                if cached:
+                    return {
+                        'success': True,
+                        'linkedin_url': linkedin_url,
+                        'company_data': cached['company_data'],
+                        'raw_data': cached['raw_data'],
+                        'data_freshness': 'cached',
+                        'extraction_timestamp': cached['fetched_at']
+                    }
+            
             # Prepare input for LinkedIn company scraper
             input_data = {
                 "companyUrls": [linkedin_url],
@@ -251,12 +463,15 @@ class ApifyService:
             # Extract and structure relevant information
             structured_data = self._structure_linkedin_data(company_data, linkedin_url)
             
+            if self.config.ENABLE_CACHING:
+                await self.cache.put(linkedin_url, structured_data, company_data)
+            
             return {
                 'success': True,
                 'linkedin_url': linkedin_url,
                 'company_data': structured_data,
                 'raw_data': company_data,
-                'data_freshness': 'fresh' if force_refresh else 'cached',
+                'data_freshness': 'fresh',
                 'extraction_timestamp': time.time()
             }
             
@@ -310,26 +525,9 @@ class ApifyService:
     
     def _parse_employee_count(self, company_size: str) -> Optional[int]:
         """Parse employee count from LinkedIn company size string"""
-        try:
-            import re
-            
-            # Common patterns: "51-200 employees", "1,001-5,000 employees"
-            size_lower = company_size.lower()
-            
-            if 'employee' not in size_lower:
-                return None
-            
-            # Extract numbers
-            numbers = re.findall(r'[\d,]+', company_size)
-            if not numbers:
-                return None
-            
-            # Take the first number as rough estimate
-            first_num = numbers[0].replace(',', '')
-            return int(first_num)
-            
-        except Exception:
+        if not isinstance(company_size, str):
             return None
+        return _employee_count_from_size(company_size)
     
     def _calculate_growth_metrics(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate growth metrics from LinkedIn data"""
@@ -367,33 +565,44 @@ class ApifyService:
     
     def _calculate_data_quality(self, structured_data: Dict[str, Any]) -> float:
         """Calculate data quality score (0-1)"""
-        score = 0.0
-        total_fields = 0
-        
-        # Core fields
-        core_fields = [
-            'company_name', 'description', 'industry', 
-            'company_size', 'headquarters', 'website'
-        ]
-        
-        for field in core_fields:
-            total_fields += 1
-            if structured_data.get(field):
-                score += 1
-        
-        # Bonus for additional data
-        if structured_data.get('founded'):
-            score += 0.5
-        if structured_data.get('specialties'):
-            score += 0.5
-        if structured_data.get('employee_count'):
-            score += 0.5
-        if structured_data.get('recent_updates'):
-            score += 0.5
-        
-        total_fields += 2  # Adjust for bonus fields
+        score = sum(
+            weight for field, weight in _QUALITY_WEIGHTS if structured_data.get(field)
+        )
+        return min(1.0, score / _QUALITY_TOTAL)
+    
+    def _structure_batch(self, chunks: List[tuple]) -> tuple:
+        """Structure actor results, keyed by the URL that was requested
         
-        return min(1.0, score / total_fields)
+        Takes (requested_urls, results) pairs, one per actor run, and returns
+        (url, structured_data, raw_data) tuples plus the requested URLs that
+        got no matching item.
+        """
+        structured = []
+        missing = []
+        for requested_urls, results in chunks:
+            pending = {}
+            for url in requested_urls:
+                pending.setdefault(_normalize_linkedin_url(url), url)
+            
+            unmatched = []
+            for result in results:
+                if not isinstance(result, dict):
+                    continue
+                url = pending.pop(_normalize_linkedin_url(result.get('url') or ''), None)
+                if url is None:
+                    unmatched.append(result)
+                else:
+                    structured.append((url, self._structure_linkedin_data(result, url), result))
+            
+            # A lone leftover item can only belong to a lone leftover URL
+            if len(unmatched) == 1 and len(pending) == 1:
+                url = pending.popitem()[1]
+                structured.append((url, self._structure_linkedin_data(unmatched[0], url), unmatched[0]))
+            elif unmatched:
+                logger.warning(f"Dropped {len(unmatched)} LinkedIn results not matching a requested URL")
+            
+            missing.extend(pending.values())
+        return structured, missing
     
     async def get_multiple_companies(
         self,
@@ -403,42 +612,85 @@ class ApifyService:
         """Get data for multiple LinkedIn companies"""
         try:
             logger.info(f"Fetching LinkedIn data for {len(linkedin_urls)} companies")
+            # One timestamp for the whole batch, so fresh entries agree
+            extraction_timestamp = time.time()
+            
+            # Serve what we can from the local cache and only scrape the rest
+            cached = {}
+            if self.config.ENABLE_CACHING and not force_refresh:
+                cached = await self.cache.get_many(linkedin_urls)
+            misses = [url for url in linkedin_urls if url not in cached]
+            
+            fetched = {}
+            failed_urls = []
+            if misses:
+                # Shard into several smaller actor runs so they proceed in
+                # parallel and one bad chunk does not fail the whole batch
+                chunks = [
+                    misses[i:i + self.batch_chunk_size]
+                    for i in range(0, len(misses), self.batch_chunk_size)
+                ]
+                chunk_results = await asyncio.gather(*(
+                    self._run_actor(self.linkedin_actor_id, {
+                        "companyUrls": chunk,
+                        "useCache": not force_refresh,
+                        "saveToDataset": True
+                    })
+                    for chunk in chunks
+                ), return_exceptions=True)
+                
+                succeeded = []
+                for chunk, chunk_result in zip(chunks, chunk_results):
+                    if isinstance(chunk_result, BaseException) or not chunk_result:
+                        logger.error(f"LinkedIn batch chunk of {len(chunk)} URLs failed: {chunk_result or 'no results'}")
+                        failed_urls.extend(chunk)
+                    else:
+                        succeeded.append((chunk, chunk_result))
+                
+                if not succeeded and not cached:
+                    return {
+                        'success': False,
+                        'error': 'Failed to run LinkedIn batch scraper',
+                        'requested_urls': linkedin_urls
+                    }
+                
+                # Process results off the event loop; large batches are CPU-bound
+                to_cache, missing = await asyncio.to_thread(self._structure_batch, succeeded)
+                failed_urls.extend(missing)
+                for company_url, structured_data, _ in to_cache:
+                    fetched[company_url] = {
+                        'linkedin_url': company_url,
+                        'success': True,
+                        'data': structured_data,
+                        'data_freshness': 'fresh',
+                        'extraction_timestamp': extraction_timestamp
+                    }
+                
+                if to_cache and self.config.ENABLE_CACHING:
+                    await self.cache.put_many(to_cache)
             
-            # Prepare input for batch processing
-            input_data = {
-                "companyUrls": linkedin_urls,
-                "useCache": not force_refresh,
-                "saveToDataset": True
-            }
-            
-            # Run the actor
-            results = await self._run_actor(self.linkedin_actor_id, input_data)
-            
-            if not results:
-                return {
-                    'success': False,
-                    'error': 'Failed to run LinkedIn batch scraper',
-                    'requested_urls': linkedin_urls
-                }
-            
-            # Process results
             processed_companies = []
-            for result in results:
-                if isinstance(result, dict):
-                    company_url = result.get('url', '')
-                    structured_data = self._structure_linkedin_data(result, company_url)
+            for url in linkedin_urls:
+                if url in cached:
                     processed_companies.append({
-                        'linkedin_url': company_url,
+                        'linkedin_url': url,
                         'success': True,
-                        'data': structured_data
+                        'data': cached[url]['company_data'],
+                        'data_freshness': 'cached',
+                        'extraction_timestamp': cached[url]['fetched_at']
                     })
+                elif url in fetched:
+                    processed_companies.append(fetched[url])
             
             return {
                 'success': True,
                 'requested_urls': linkedin_urls,
                 'processed_count': len(processed_companies),
                 'companies': processed_companies,
-                'extraction_timestamp': time.time()
+                'cache_hits': len(cached),
+                'cache_misses': len(misses),
+                'failed_urls': failed_urls,
+                'extraction_timestamp': extraction_timestamp
             }
             
         except Exception as e:
@@ -452,8 +704,10 @@ class ApifyService:
     def get_usage_stats(self) -> Dict[str, Any]:
         """Get API usage statistics"""
         return {
-            'requests_made_this_hour': self.request_count,
+            'requests_made': self.request_count,
+            'requests_last_hour': len(self._request_times),
             'requests_per_hour_limit': self.requests_per_hour,
-            'hour_started_at': self.hour_start,
-            'last_request_time': self.last_request_time
+            'tokens_available': self._tokens,
+            'last_request_time': self.last_request_time,
+            **self.cache.stats()
         }
\ No newline at end of file
@@ -2,51 +2,145 @@
 AWS Bedrock LLM service for M&A Research Assistant
 """
 
-import json
+import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import boto3
+import orjson
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
-from tenacity import retry, stop_after_attempt, wait_exponential
+from pydantic import ValidationError
 
+from ..core.cache import get_llm_response_cache
 from ..core.config import get_config
+from ..core.rate_limit import TokenBucket
+from ..models import DimensionScoreResponse
 
 logger = logging.getLogger(__name__)
 
+# Output token ceiling shared by the Claude and Nova models in use
+MAX_OUTPUT_TOKENS = 8192
+
+# Claude requests allowing this many output tokens are streamed, so long
+# generations keep bytes flowing instead of idling against the read timeout
+STREAM_MIN_MAX_TOKENS = 2000
+
+_DIMENSION_SYSTEM_PROMPT = """You are an expert M&A analyst specializing in software company evaluation.
+Your task is to score companies on specific dimensions for acquisition assessment.
+
+IMPORTANT: You must provide your response as valid JSON with the following structure:
+{{
+    "score": <numeric_score>,
+    "confidence": <confidence_0_to_1>,
+    "evidence": ["<evidence_point_1>", "<evidence_point_2>", ...],
+    "reasoning": "<detailed_reasoning>",
+    "data_sources": ["<source_1>", "<source_2>", ...]
+}}
+
+Dimension: {dimension_name}
+Description: {dimension_description}
+Score Range: {min_score} to {max_score}
+
+Scoring Criteria:
+{scoring_criteria}"""
+
+
+def _compact_json(data: Any) -> str:
+    """Serialise prompt data without whitespace, which would only add input tokens"""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+@lru_cache(maxsize=512)
+def _dump_criteria(items: tuple) -> str:
+    return _compact_json(dict(items))
+
+
+def _criteria_json(scoring_criteria: Dict[str, Any]) -> str:
+    """Serialise scoring criteria, reusing the result for criteria seen before"""
+    items = tuple(scoring_criteria.items())
+    try:
+        return _dump_criteria(items)
+    except TypeError:
+        # Unhashable criteria values (lists, dicts) can't be cached
+        return _compact_json(scoring_criteria)
+
+
+@lru_cache(maxsize=1)
+def _get_bedrock_client():
+    """Get process-wide bedrock-runtime client with a pooled, kept-alive connection"""
+    config = get_config()
+    return boto3.client(
+        service_name="bedrock-runtime",
+        region_name=config.BEDROCK_REGION,
+        aws_access_key_id=config.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=config.AWS_SECRET_ACCESS_KEY,
+        config=BotoConfig(
+            # Room for every concurrent call without opening new TLS connections
+            max_pool_connections=max(50, config.BEDROCK_MAX_CONCURRENT * 2),
+            tcp_keepalive=True,
+            # The only retries: throttling and transient errors are retried
+            # here, then generate_response falls back to the other model once
+            retries={"max_attempts": 3, "mode": "adaptive"},
+            connect_timeout=5,
+            read_timeout=60
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_bedrock_executor() -> ThreadPoolExecutor:
+    """Get thread pool for blocking Bedrock calls, sized to the concurrency limit"""
+    return ThreadPoolExecutor(
+        max_workers=get_config().BEDROCK_MAX_CONCURRENT,
+        thread_name_prefix="bedrock"
+    )
+
 
 class BedrockLLMService:
     """AWS Bedrock LLM service with Claude and Nova Pro models"""
     
     def __init__(self):
         self.config = get_config()
-        self.bedrock_client = boto3.client(
-            service_name="bedrock-runtime",
-            region_name=self.config.BEDROCK_REGION,
-            aws_access_key_id=self.config.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=self.config.AWS_SECRET_ACCESS_KEY
-        )
+        self.bedrock_client = _get_bedrock_client()
+        self._executor = _get_bedrock_executor()
         
-        self.primary_model = self.config.BEDROCK_PRIMARY_MODEL
-        self.fallback_model = self.config.BEDROCK_FALLBACK_MODEL
+        self.primary_model = self.config.BEDROCK_PRIMARY_MODEL_ARN or self.config.BEDROCK_PRIMARY_MODEL
+        self.fallback_model = self.config.BEDROCK_FALLBACK_MODEL_ARN or self.config.BEDROCK_FALLBACK_MODEL
+        
+        # Request body shape follows the base model, which a provisioned
+        # throughput ARN does not name
+        self._model_families = {
+            self.primary_model: self.config.BEDROCK_PRIMARY_MODEL.lower(),
+            self.fallback_model: self.config.BEDROCK_FALLBACK_MODEL.lower()
+        }
         
         # Rate limiting
         self.requests_per_minute = self.config.BEDROCK_REQUESTS_PER_MINUTE
         self.tokens_per_minute = self.config.BEDROCK_TOKENS_PER_MINUTE
         self.max_concurrent = self.config.BEDROCK_MAX_CONCURRENT
         
+        # Separate buckets for requests and tokens per minute; the token
+        # bucket is charged with actual usage once a response comes back
+        self._request_bucket = TokenBucket(
+            self.requests_per_minute, self.config.bedrock_request_interval_s
+        )
+        self._token_bucket = TokenBucket(
+            self.tokens_per_minute, self.config.bedrock_token_interval_s
+        )
+        
         # Token tracking
         self.total_tokens_used = 0
         self.total_requests_made = 0
-        self.last_reset_time = time.time()
+        
+        self.cache = get_llm_response_cache()
+        self._inflight: Dict[bytes, asyncio.Future] = {}
         
         logger.info(f"Initialized Bedrock service with primary model: {self.primary_model}")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
     async def generate_response(
         self,
         prompt: str,
@@ -56,18 +150,65 @@ class BedrockLLMService:
         use_fallback: bool = False
     ) -> Dict[str, Any]:
         """Generate response using Bedrock LLM"""
+        model_id = self.fallback_model if use_fallback else self.primary_model
+        key = self.cache.key(
+            model_id=model_id,
+            system_prompt=system_prompt,
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        
+        if self.config.ENABLE_CACHING:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {**cached, "cached": True}
+        
+        # Identical requests already in flight share that call's result; if
+        # that call gets cancelled, a waiter makes the call itself
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return {**await asyncio.shield(inflight)}
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._generate_response(
+                key, model_id, prompt, max_tokens, temperature, system_prompt, use_fallback
+            )
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        future.set_result(result)
+        return result
+    
+    async def _generate_response(
+        self,
+        key: bytes,
+        model_id: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+        use_fallback: bool
+    ) -> Dict[str, Any]:
+        """Call the model for a request that is neither cached nor in flight"""
         try:
-            model_id = self.fallback_model if use_fallback else self.primary_model
-            
             # Check rate limits
             await self._check_rate_limits()
             
             # Prepare request based on model type
-            if "claude" in model_id.lower():
+            model_family = self._model_families.get(model_id, model_id.rsplit("/", 1)[-1].lower())
+            if "claude" in model_family:
                 response = await self._call_claude_model(
                     model_id, prompt, max_tokens, temperature, system_prompt
                 )
-            elif "nova" in model_id.lower():
+            elif "nova" in model_family:
                 response = await self._call_nova_model(
                     model_id, prompt, max_tokens, temperature, system_prompt
                 )
@@ -75,20 +216,28 @@ class BedrockLLMService:
                 raise ValueError(f"Unsupported model: {model_id}")
             
             # Track usage
+            tokens_used = response.get("tokens_used", 0)
+            self._token_bucket.charge(max(tokens_used - 1, 0))
+            self.total_tokens_used += tokens_used
             self.total_requests_made += 1
             
-            return {
+            result = {
                 "success": True,
                 "response": response["content"],
                 "model_used": model_id,
-                "tokens_used": response.get("tokens_used", 0),
+                "tokens_used": tokens_used,
                 "stop_reason": response.get("stop_reason", "complete")
             }
+            if self.config.ENABLE_CACHING:
+                self.cache.put(key, result)
+            return result
             
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             
-            if error_code == 'ThrottlingException' and not use_fallback:
+            # Errors raised mid-stream (EventStreamError) carry the event
+            # name, e.g. "throttlingException", so compare without case
+            if error_code.lower() == 'throttlingexception' and not use_fallback:
                 logger.warning("Primary model throttled, trying fallback")
                 return await self.generate_response(
                     prompt, max_tokens, temperature, system_prompt, use_fallback=True
@@ -107,6 +256,60 @@ class BedrockLLMService:
                 "error": str(e)
             }
     
+    def _invoke_model_sync(self, model_id: str, body: bytes) -> Dict[str, Any]:
+        """Invoke a model and read the full response body (blocking)"""
+        response = self.bedrock_client.invoke_model(
+            modelId=model_id,
+            body=body,
+            contentType="application/json"
+        )
+        return orjson.loads(response['body'].read())
+    
+    def _invoke_claude_stream_sync(self, model_id: str, body: bytes) -> Dict[str, Any]:
+        """Invoke a Claude model with a streamed response and assemble it (blocking)
+        
+        Returns the same shape as a non-streamed Claude response body.
+        """
+        response = self.bedrock_client.invoke_model_with_response_stream(
+            modelId=model_id,
+            body=body,
+            contentType="application/json"
+        )
+        
+        text = []
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        stop_reason = "complete"
+        for event in response["body"]:
+            chunk = event.get("chunk")
+            if chunk is None:
+                continue
+            data = orjson.loads(chunk["bytes"])
+            event_type = data.get("type")
+            if event_type == "content_block_delta":
+                text.append(data["delta"].get("text", ""))
+            elif event_type == "message_start":
+                usage["input_tokens"] = data["message"].get("usage", {}).get("input_tokens", 0)
+            elif event_type == "message_delta":
+                usage["output_tokens"] = data.get("usage", {}).get("output_tokens", 0)
+                stop_reason = data["delta"].get("stop_reason") or stop_reason
+        
+        return {
+            "content": [{"text": "".join(text)}],
+            "usage": usage,
+            "stop_reason": stop_reason
+        }
+    
+    async def _invoke_model(
+        self,
+        model_id: str,
+        body: bytes,
+        stream: bool = False
+    ) -> Dict[str, Any]:
+        """Invoke a model without blocking the event loop"""
+        invoke = self._invoke_claude_stream_sync if stream else self._invoke_model_sync
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, invoke, model_id, body)
+    
     async def _call_claude_model(
         self,
         model_id: str,
@@ -128,14 +331,10 @@ class BedrockLLMService:
         if system_prompt:
             body["system"] = system_prompt
         
-        response = self.bedrock_client.invoke_model(
-            modelId=model_id,
-            body=json.dumps(body),
-            contentType="application/json"
+        response_body = await self._invoke_model(
+            model_id, orjson.dumps(body), stream=max_tokens >= STREAM_MIN_MAX_TOKENS
         )
         
-        response_body = json.loads(response['body'].read())
-        
         return {
             "content": response_body["content"][0]["text"],
             "tokens_used": response_body.get("usage", {}).get("input_tokens", 0) + 
@@ -165,40 +364,26 @@ class BedrockLLMService:
             }
         }
         
-        response = self.bedrock_client.invoke_model(
-            modelId=model_id,
-            body=json.dumps(body),
-            contentType="application/json"
-        )
+        response_body = await self._invoke_model(model_id, orjson.dumps(body))
         
-        response_body = json.loads(response['body'].read())
+        result = response_body["results"][0]
+        output_tokens = result.get("tokenCount")
+        if output_tokens is None:
+            # Rough estimate of ~4 characters per token when usage is missing
+            output_tokens = len(result["outputText"]) // 4
         
         return {
-            "content": response_body["results"][0]["outputText"],
-            "tokens_used": response_body.get("inputTextTokenCount", 0) + 
-                          len(response_body["results"][0]["outputText"].split()),
-            "stop_reason": response_body["results"][0].get("completionReason", "complete")
+            "content": result["outputText"],
+            "tokens_used": response_body.get("inputTextTokenCount", 0) + output_tokens,
+            "stop_reason": result.get("completionReason", "complete")
         }
     
     async def _check_rate_limits(self) -> None:
-        """Check and enforce rate limits"""
-        current_time = time.time()
-        
-        # Reset counters every minute
-        if current_time - self.last_reset_time >= 60:
-            self.total_tokens_used = 0
-            self.total_requests_made = 0
-            self.last_reset_time = current_time
-        
-        # Check limits
-        if self.total_requests_made >= self.requests_per_minute:
-            sleep_time = 60 - (current_time - self.last_reset_time)
-            if sleep_time > 0:
-                logger.warning(f"Rate limit hit, sleeping {sleep_time:.1f}s")
-                time.sleep(sleep_time)
-                self.total_tokens_used = 0
-                self.total_requests_made = 0
-                self.last_reset_time = time.time()
+        """Wait for request and token budget"""
+        await self._request_bucket.acquire()
+        # One token up front keeps callers waiting while earlier responses
+        # have overdrawn the per-minute token budget
+        await self._token_bucket.acquire()
     
     async def score_dimension(
         self,
@@ -211,29 +396,18 @@ class BedrockLLMService:
     ) -> Dict[str, Any]:
         """Score a specific dimension using LLM"""
         
-        system_prompt = f"""You are an expert M&A analyst specializing in software company evaluation.
-Your task is to score companies on specific dimensions for acquisition assessment.
-
-IMPORTANT: You must provide your response as valid JSON with the following structure:
-{{
-    "score": <numeric_score>,
-    "confidence": <confidence_0_to_1>,
-    "evidence": ["<evidence_point_1>", "<evidence_point_2>", ...],
-    "reasoning": "<detailed_reasoning>",
-    "data_sources": ["<source_1>", "<source_2>", ...]
-}}
-
-Dimension: {dimension_name}
-Description: {dimension_description}
-Score Range: {min_score} to {max_score}
-
-Scoring Criteria:
-{json.dumps(scoring_criteria, indent=2)}"""
+        system_prompt = _DIMENSION_SYSTEM_PROMPT.format(
+            dimension_name=dimension_name,
+            dimension_description=dimension_description,
+            min_score=min_score,
+            max_score=max_score,
+            scoring_criteria=_criteria_json(scoring_criteria)
+        )
 
         prompt = f"""Based on the following company data, score this company on the "{dimension_name}" dimension.
 
 Company Data:
-{json.dumps(company_data, indent=2, default=str)}
+{_compact_json(company_data)}
 
 Provide your analysis as valid JSON following the required structure."""
 
@@ -250,19 +424,11 @@ Provide your analysis as valid JSON following the required structure."""
             
             # Parse JSON response
             try:
-                result = json.loads(response["response"])
-                
-                # Validate required fields
-                required_fields = ["score", "confidence", "evidence", "reasoning", "data_sources"]
-                for field in required_fields:
-                    if field not in result:
-                        result[field] = []
-                
-                # Validate score range
-                score = float(result["score"])
-                if score < min_score or score > max_score:
-                    logger.warning(f"Score {score} outside range [{min_score}, {max_score}], clamping")
-                    result["score"] = max(min_score, min(max_score, score))
+                result = self._dimension_result(
+                    DimensionScoreResponse.model_validate_json(response["response"]),
+                    min_score,
+                    max_score
+                )
                 
                 # Add metadata
                 result["model_used"] = response["model_used"]
@@ -273,7 +439,7 @@ Provide your analysis as valid JSON following the required structure."""
                     "dimension_score": result
                 }
                 
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 logger.error(f"Failed to parse LLM response as JSON: {e}")
                 logger.error(f"Response: {response['response'][:500]}...")
                 
@@ -290,6 +456,124 @@ Provide your analysis as valid JSON following the required structure."""
                 "error": str(e)
             }
     
+    @staticmethod
+    def _dimension_result(
+        parsed: DimensionScoreResponse,
+        min_score: float,
+        max_score: float
+    ) -> Dict[str, Any]:
+        """Convert a validated dimension score to a dict, clamping the score"""
+        result = parsed.model_dump()
+        score = result["score"]
+        if score < min_score or score > max_score:
+            logger.warning(f"Score {score} outside range [{min_score}, {max_score}], clamping")
+            result["score"] = max(min_score, min(max_score, score))
+        return result
+    
+    async def score_dimensions_batch(
+        self,
+        dimensions: List[Dict[str, Any]],
+        company_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Score several dimensions in one LLM call
+        
+        Each dimension is a dict with name, description, scoring_criteria,
+        min_score and max_score. Dimensions missing from the model's answer
+        are listed in missing_dimensions so callers can score them singly.
+        """
+        dimension_specs = "\n\n".join(
+            f"""Dimension: {d["name"]}
+Description: {d["description"]}
+Score Range: {d.get("min_score", 0.0)} to {d.get("max_score", 10.0)}
+Scoring Criteria:
+{_criteria_json(d["scoring_criteria"])}"""
+            for d in dimensions
+        )
+        
+        system_prompt = f"""You are an expert M&A analyst specializing in software company evaluation.
+Your task is to score companies on several dimensions for acquisition assessment.
+
+IMPORTANT: You must provide your response as valid JSON with the following structure:
+{{
+    "scores": [
+        {{
+            "dimension": "<dimension_name>",
+            "score": <numeric_score>,
+            "confidence": <confidence_0_to_1>,
+            "evidence": ["<evidence_point_1>", "<evidence_point_2>", ...],
+            "reasoning": "<detailed_reasoning>",
+            "data_sources": ["<source_1>", "<source_2>", ...]
+        }},
+        ...
+    ]
+}}
+
+Score every one of these dimensions:
+
+{dimension_specs}"""
+
+        prompt = f"""Based on the following company data, score this company on each dimension listed.
+
+Company Data:
+{_compact_json(company_data)}
+
+Provide your analysis as valid JSON following the required structure."""
+
+        try:
+            response = await self.generate_response(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                max_tokens=min(1500 * len(dimensions), MAX_OUTPUT_TOKENS),
+                temperature=0.1
+            )
+            
+            if not response["success"]:
+                return response
+            
+            try:
+                scores = orjson.loads(response["response"])["scores"]
+                by_name = {entry.get("dimension"): entry for entry in scores}
+                
+                dimension_scores = {}
+                for d in dimensions:
+                    entry = by_name.get(d["name"])
+                    if entry is None:
+                        continue
+                    try:
+                        parsed = DimensionScoreResponse.model_validate(entry)
+                    except ValidationError as e:
+                        logger.warning(f"Invalid batch score for {d['name']}: {e}")
+                        continue
+                    result = self._dimension_result(
+                        parsed, d.get("min_score", 0.0), d.get("max_score", 10.0)
+                    )
+                    result["model_used"] = response["model_used"]
+                    dimension_scores[d["name"]] = result
+                
+                return {
+                    "success": True,
+                    "dimension_scores": dimension_scores,
+                    "missing_dimensions": [
+                        d["name"] for d in dimensions if d["name"] not in dimension_scores
+                    ],
+                    "tokens_used": response["tokens_used"]
+                }
+                
+            except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                logger.error(f"Failed to parse batch scoring response: {e}")
+                return {
+                    "success": False,
+                    "error": "Invalid JSON response from LLM",
+                    "raw_response": response["response"]
+                }
+                
+        except Exception as e:
+            logger.error(f"Error scoring dimensions batch: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
     async def generate_investment_thesis(
         self,
         company_data: Dict[str, Any],
@@ -327,10 +611,10 @@ IMPORTANT: Provide your response as valid JSON with this structure:
         prompt = f"""Generate an investment thesis for this software company.
 
 Company Data:
-{json.dumps(company_data, indent=2, default=str)}
+{_compact_json(company_data)}
 
 Analysis Results:
-{json.dumps(analysis_results, indent=2, default=str)}
+{_compact_json(analysis_results)}
 
 Thesis Type: {thesis_type}
 
@@ -348,7 +632,7 @@ Focus on vertical market software potential, strategic fit, and acquisition valu
                 return response
             
             try:
-                thesis = json.loads(response["response"])
+                thesis = orjson.loads(response["response"])
                 thesis["generated_at"] = time.time()
                 thesis["thesis_type"] = thesis_type
                 thesis["model_used"] = response["model_used"]
@@ -358,7 +642,7 @@ Focus on vertical market software potential, strategic fit, and acquisition valu
                     "investment_thesis": thesis
                 }
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse investment thesis JSON: {e}")
                 return {
                     "success": False,
@@ -382,5 +666,12 @@ Focus on vertical market software potential, strategic fit, and acquisition valu
             "rate_limits": {
                 "requests_per_minute": self.requests_per_minute,
                 "tokens_per_minute": self.tokens_per_minute
-            }
-        }
\ No newline at end of file
+            },
+            **self.cache.stats()
+        }
+
+
+@lru_cache(maxsize=1)
+def get_bedrock_service() -> BedrockLLMService:
+    """Get shared Bedrock service instance"""
+    return BedrockLLMService()
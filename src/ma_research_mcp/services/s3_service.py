@@ -2,16 +2,21 @@
 S3 storage service for M&A Research Assistant
 """
 
+import asyncio
+import heapq
 import json
 import logging
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
 import boto3
+import orjson
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from ..core.cache import get_s3_object_cache, invalidate
 from ..core.config import get_config
 from ..models import AnalysisResult, CompanyList, ScoringSystem
 
@@ -90,7 +95,7 @@ class S3Service:
             # Save main analysis
             await self._save_json_object(
                 f"{analysis_path}/analysis.json",
-                analysis.dict()
+                analysis.model_dump()
             )
             
             # Save raw data if provided
@@ -136,18 +141,39 @@ class S3Service:
     async def _save_json_object(self, s3_key: str, data: Dict[str, Any]) -> None:
         """Save JSON object to S3"""
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=json.dumps(data, indent=2, default=str),
-                ContentType='application/json',
-                ServerSideEncryption='AES256'
+            await self.save_file_object(
+                s3_key,
+                orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ),
+                'application/json'
             )
-            logger.debug(f"Saved object to s3://{self.bucket_name}/{s3_key}")
         except ClientError as e:
             logger.error(f"Failed to save object {s3_key}: {e}")
             raise
     
+    async def save_file_object(self, s3_key: str, body: bytes, content_type: str) -> None:
+        """Save raw object to S3"""
+        # boto3 is blocking, so S3 calls run in worker threads to keep the
+        # event loop serving other requests
+        await asyncio.to_thread(
+            self.s3_client.put_object,
+            Bucket=self.bucket_name,
+            Key=s3_key,
+            Body=body,
+            ContentType=content_type,
+            ServerSideEncryption='AES256'
+        )
+        invalidate(s3_key)
+        logger.debug(f"Saved object to s3://{self.bucket_name}/{s3_key}")
+    
+    def _read_object(self, s3_key: str) -> bytes:
+        """Download object body (blocking)"""
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+        return response['Body'].read()
+    
     async def _update_latest_analysis(self, company_name: str, analysis_path: str) -> None:
         """Update latest analysis pointer"""
         base_path = self._get_company_base_path(company_name)
@@ -194,12 +220,23 @@ class S3Service:
         except Exception as e:
             logger.warning(f"Failed to update company index: {e}")
     
-    async def _load_json_object(self, s3_key: str) -> Optional[Dict[str, Any]]:
+    async def _load_json_object(
+        self,
+        s3_key: str,
+        use_cache: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """Load JSON object from S3"""
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
-            content = response['Body'].read().decode('utf-8')
-            return json.loads(content)
+            # The body is cached rather than the parsed object so every
+            # caller gets its own copy to mutate
+            cache = get_s3_object_cache() if use_cache and self.config.ENABLE_CACHING else None
+            content = cache.get(s3_key) if cache is not None else None
+            if content is None:
+                generation = cache.generation if cache is not None else 0
+                content = await asyncio.to_thread(self._read_object, s3_key)
+                if cache is not None:
+                    cache.put(s3_key, content, generation)
+            return orjson.loads(content)
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
                 return None
@@ -221,13 +258,17 @@ class S3Service:
             else:
                 # Get latest analysis
                 base_path = self._get_company_base_path(company_name)
-                latest_data = await self._load_json_object(f"{base_path}/latest/pointer.json")
+                latest_data = await self._load_json_object(
+                    f"{base_path}/latest/pointer.json", use_cache=True
+                )
                 if not latest_data:
                     return None
                 analysis_path = latest_data["latest_analysis_path"]
             
             # Load analysis data
-            analysis_data = await self._load_json_object(f"{analysis_path}/analysis.json")
+            analysis_data = await self._load_json_object(
+                f"{analysis_path}/analysis.json", use_cache=True
+            )
             if not analysis_data:
                 return None
             
@@ -247,7 +288,8 @@ class S3Service:
             base_path = self._get_company_base_path(company_name)
             
             # List all analysis timestamps
-            response = self.s3_client.list_objects_v2(
+            response = await asyncio.to_thread(
+                self.s3_client.list_objects_v2,
                 Bucket=self.bucket_name,
                 Prefix=f"{base_path}/",
                 Delimiter='/'
@@ -298,23 +340,16 @@ class S3Service:
             companies_index = await self._load_json_object("_index/companies_list.json") or []
             
             # Apply filters
-            filtered = []
-            for company in companies_index:
-                if self._matches_criteria(company, criteria):
-                    filtered.append(company)
-            
-            # Sort
-            if sort_by in ["overall_score", "last_updated"]:
-                reverse = True
-            else:
-                reverse = False
-            
-            filtered.sort(
-                key=lambda x: x.get(sort_by, 0), 
-                reverse=reverse
+            filtered = (
+                company for company in companies_index
+                if self._matches_criteria(company, criteria)
             )
             
-            return filtered[:limit]
+            # Select the top `limit` without sorting every match; nlargest and
+            # nsmallest give the same order as a sorted slice
+            select = heapq.nlargest if sort_by in ["overall_score", "last_updated"] else heapq.nsmallest
+            
+            return select(limit, filtered, key=lambda x: x.get(sort_by, 0))
             
         except Exception as e:
             logger.error(f"Failed to search companies: {e}")
@@ -344,7 +379,7 @@ class S3Service:
         """Save scoring system configuration"""
         try:
             s3_key = f"scoring_systems/{scoring_system.system_id}/configuration.json"
-            await self._save_json_object(s3_key, scoring_system.dict())
+            await self._save_json_object(s3_key, scoring_system.model_dump())
             
             # Update registry
             await self._update_scoring_system_registry(scoring_system)
@@ -408,4 +443,10 @@ class S3Service:
             return url
         except Exception as e:
             logger.error(f"Failed to generate presigned URL for {s3_key}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+@lru_cache(maxsize=1)
+def get_s3_service() -> S3Service:
+    """Get shared S3 service instance"""
+    return S3Service()
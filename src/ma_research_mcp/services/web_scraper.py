@@ -34,7 +34,7 @@ class WebScrapingService:
         
         # Resource limits
         self.max_pages_per_company = self.config.MAX_PAGES_PER_COMPANY
-        self.max_content_size = self._parse_size(self.config.MAX_WEBSITE_CONTENT_SIZE)
+        self.max_content_size = self.config.MAX_WEBSITE_CONTENT_SIZE
         
         # Priority keywords for content discovery
         self.priority_keywords = [
@@ -55,16 +55,6 @@ class WebScrapingService:
         
         logger.info("Initialized web scraping service")
     
-    def _parse_size(self, size_str: str) -> int:
-        """Parse size string like '10MB' to bytes"""
-        size_str = size_str.upper()
-        if 'MB' in size_str:
-            return int(size_str.replace('MB', '')) * 1024 * 1024
-        elif 'KB' in size_str:
-            return int(size_str.replace('KB', '')) * 1024
-        else:
-            return int(size_str)
-    
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self.session is None or self.session.closed:
@@ -537,8 +527,6 @@ class WebScrapingService:
         if hasattr(self, 'session') and self.session and not self.session.closed:
             # Note: This is not ideal for async cleanup, but serves as fallback
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.session.close())
+                asyncio.get_running_loop().create_task(self.session.close())
             except:
                 pass
\ No newline at end of file
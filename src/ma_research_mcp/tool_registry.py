@@ -0,0 +1,252 @@
+"""
+MCP tool registry shared by the STDIO and HTTP servers
+"""
+
+import importlib
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+import orjson
+from fastmcp import FastMCP
+from pydantic import BaseModel
+
+from .core.config import get_config
+from .models.analysis import FilterCriteria
+
+
+# Tool implementations pull in boto3, Bedrock, Apify and the export stack,
+# so they are imported on first invocation rather than at server start.
+@lru_cache(maxsize=None)
+def _resolve(name: str) -> Callable[..., Any]:
+    """Import a tool implementation on first use"""
+    tools = importlib.import_module(".tools", __package__)
+    return getattr(tools, name)
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for values orjson cannot encode natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
+def serialize_tool_result(data: Any) -> str:
+    """Serialize a tool result to compact JSON for the MCP response"""
+    if isinstance(data, str):
+        return data
+    return orjson.dumps(
+        data, default=_json_default, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+async def analyze_company_tool(
+    company_name: str,
+    website_url: str,
+    linkedin_url: str = "",
+    force_refresh: bool = False,
+    skip_filtering: bool = False,
+    manual_override: bool = False
+) -> Dict[str, Any]:
+    """Orchestrates complete company analysis with scoring and qualification"""
+    return await _resolve("analyze_company")(
+        company_name, website_url, linkedin_url, 
+        force_refresh, skip_filtering, manual_override
+    )
+
+async def scrape_website_tool(
+    website_url: str,
+    max_pages: int = 5,
+    priority_keywords: list[str] = None
+) -> Dict[str, Any]:
+    """Intelligent website scraping with priority keyword targeting"""
+    return await _resolve("scrape_website")(website_url, max_pages, priority_keywords or [])
+
+async def get_linkedin_data_tool(
+    linkedin_url: str,
+    force_refresh: bool = False
+) -> Dict[str, Any]:
+    """Fetches LinkedIn company data via Apify API"""
+    return await _resolve("get_linkedin_data")(linkedin_url, force_refresh)
+
+async def score_dimension_tool(
+    dimension_name: str,
+    company_data: Dict[str, Any],
+    scoring_system_id: str = "default"
+) -> Dict[str, Any]:
+    """Generic scoring function for any dimension"""
+    return await _resolve("score_dimension")(dimension_name, company_data, scoring_system_id)
+
+async def enrich_company_data_tool(
+    company_name: str,
+    base_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Enhance company data from additional sources"""
+    return await _resolve("enrich_company_data")(company_name, base_data)
+
+async def get_company_history_tool(
+    company_name: str,
+    limit: int = 10
+) -> Dict[str, Any]:
+    """Retrieves historical analyses for a company"""
+    return await _resolve("get_company_history")(company_name, limit)
+
+async def compare_analyses_tool(
+    company_name: str,
+    analysis1_timestamp: str,
+    analysis2_timestamp: str
+) -> Dict[str, Any]:
+    """Compares two analyses of the same company"""
+    return await _resolve("compare_analyses")(company_name, analysis1_timestamp, analysis2_timestamp)
+
+async def bulk_analyze_tool(
+    companies: list[Dict[str, str]],
+    max_parallel: int = 5
+) -> Dict[str, Any]:
+    """Parallel analysis of multiple companies"""
+    return await _resolve("bulk_analyze")(companies, max_parallel)
+
+async def bulk_filter_tool(
+    companies: list[str],
+    criteria: FilterCriteria
+) -> Dict[str, Any]:
+    """Filter multiple companies against qualification criteria"""
+    return await _resolve("bulk_filter")(companies, criteria)
+
+async def run_custom_scoring_tool(
+    company_name: str,
+    scoring_system_ids: list[str]
+) -> Dict[str, Any]:
+    """Run specific scoring systems on a company"""
+    return await _resolve("run_custom_scoring")(company_name, scoring_system_ids)
+
+async def search_companies_tool(
+    criteria: Dict[str, Any],
+    sort_by: str = "overall_score",
+    limit: int = 50
+) -> Dict[str, Any]:
+    """Search analyzed companies by various criteria"""
+    return await _resolve("search_companies")(criteria, sort_by, limit)
+
+async def export_report_tool(
+    company_names: list[str],
+    format: str = "json",
+    include_raw_data: bool = False
+) -> Dict[str, Any]:
+    """Generate formatted reports for companies"""
+    return await _resolve("export_report")(company_names, format, include_raw_data)
+
+async def generate_xlsx_export_tool(
+    companies: list[str],
+    include_charts: bool = True,
+    custom_fields: list[str] = None
+) -> Dict[str, Any]:
+    """Generate downloadable XLSX files with formatting"""
+    return await _resolve("generate_xlsx_export")(companies, include_charts, custom_fields or [])
+
+async def qualify_lead_tool(
+    company_name: str,
+    force_requalification: bool = False
+) -> Dict[str, Any]:
+    """Complete multi-tier lead qualification"""
+    return await _resolve("qualify_lead")(company_name, force_requalification)
+
+async def generate_investment_thesis_tool(
+    company_name: str,
+    thesis_type: str = "standard"
+) -> Dict[str, Any]:
+    """AI-powered investment thesis generation"""
+    return await _resolve("generate_investment_thesis")(company_name, thesis_type)
+
+async def manage_lead_nurturing_tool(
+    company_name: str,
+    action: str,
+    tier: str = None,
+    notes: str = ""
+) -> Dict[str, Any]:
+    """Update lead tier and nurturing activities"""
+    return await _resolve("manage_lead_nurturing")(company_name, action, tier, notes)
+
+async def manage_scoring_systems_tool(
+    action: str,
+    system_data: Dict[str, Any] = None,
+    system_id: str = ""
+) -> Dict[str, Any]:
+    """Create and manage custom scoring systems"""
+    return await _resolve("manage_scoring_systems")(action, system_data, system_id)
+
+async def override_company_tier_tool(
+    company_name: str,
+    new_tier: str,
+    reason: str,
+    override_by: str
+) -> Dict[str, Any]:
+    """Manual tier override with approval workflow"""
+    return await _resolve("override_company_tier")(company_name, new_tier, reason, override_by)
+
+async def manage_company_lists_tool(
+    action: str,
+    company_name: str = "",
+    list_type: str = "active",
+    metadata: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """Manage active and future candidate lists"""
+    return await _resolve("manage_company_lists")(action, company_name, list_type, metadata or {})
+
+async def update_metadata_tool(
+    company_name: str,
+    metadata_updates: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Manual metadata updates for companies"""
+    return await _resolve("update_metadata")(company_name, metadata_updates)
+
+@lru_cache(maxsize=1)
+def _health_base() -> Dict[str, Any]:
+    """Static part of the health check response, built on first probe"""
+    return {
+        "status": "healthy",
+        "version": "1.0.0",
+        "server_name": get_config().MCP_SERVER_NAME
+    }
+
+
+def health_status() -> Dict[str, Any]:
+    """Build a health check response"""
+    return {**_health_base(), "timestamp": time.monotonic()}
+
+
+async def health_check() -> Dict[str, Any]:
+    """Health check endpoint for monitoring"""
+    return health_status()
+
+
+# Registration order is the order tools are listed to MCP clients
+TOOLS = [
+    analyze_company_tool,
+    scrape_website_tool,
+    get_linkedin_data_tool,
+    score_dimension_tool,
+    enrich_company_data_tool,
+    get_company_history_tool,
+    compare_analyses_tool,
+    bulk_analyze_tool,
+    bulk_filter_tool,
+    run_custom_scoring_tool,
+    search_companies_tool,
+    export_report_tool,
+    generate_xlsx_export_tool,
+    qualify_lead_tool,
+    generate_investment_thesis_tool,
+    manage_lead_nurturing_tool,
+    manage_scoring_systems_tool,
+    override_company_tier_tool,
+    manage_company_lists_tool,
+    update_metadata_tool,
+    health_check,
+]
+
+
+def register_tools(mcp: FastMCP) -> None:
+    """Register all M&A research tools on an MCP server"""
+    for tool in TOOLS:
+        mcp.tool()(tool)
@@ -2,42 +2,58 @@
 MCP Tools for M&A Research Assistant
 """
 
-from .analysis_tools import *
-from .management_tools import *
-from .export_tools import *
+import importlib
+from typing import Any
 
-__all__ = [
+# Tool modules construct their services at import time, so each one is only
+# imported when one of its tools is first looked up (PEP 562)
+_TOOL_MODULES = {
     # Core analysis tools
-    "analyze_company",
-    "scrape_website", 
-    "get_linkedin_data",
-    "score_dimension",
-    "enrich_company_data",
-    
+    "analyze_company": ".analysis_tools",
+    "scrape_website": ".analysis_tools",
+    "get_linkedin_data": ".analysis_tools",
+    "score_dimension": ".analysis_tools",
+    "enrich_company_data": ".analysis_tools",
+
     # History and comparison
-    "get_company_history",
-    "compare_analyses",
-    
+    "get_company_history": ".analysis_tools",
+    "compare_analyses": ".analysis_tools",
+
     # Bulk operations
-    "bulk_analyze",
-    "bulk_filter",
-    "run_custom_scoring",
-    
+    "bulk_analyze": ".analysis_tools",
+    "bulk_filter": ".analysis_tools",
+    "run_custom_scoring": ".analysis_tools",
+
     # Search and discovery
-    "search_companies",
-    
+    "search_companies": ".analysis_tools",
+
     # Lead qualification
-    "qualify_lead",
-    "generate_investment_thesis",
-    "manage_lead_nurturing",
-    
+    "qualify_lead": ".analysis_tools",
+    "generate_investment_thesis": ".analysis_tools",
+    "manage_lead_nurturing": ".analysis_tools",
+
     # Management tools
-    "manage_scoring_systems",
-    "override_company_tier",
-    "manage_company_lists",
-    "update_metadata",
-    
+    "manage_scoring_systems": ".management_tools",
+    "override_company_tier": ".management_tools",
+    "manage_company_lists": ".management_tools",
+    "update_metadata": ".management_tools",
+
     # Export tools
-    "export_report",
-    "generate_xlsx_export"
-]
\ No newline at end of file
+    "export_report": ".export_tools",
+    "generate_xlsx_export": ".export_tools"
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
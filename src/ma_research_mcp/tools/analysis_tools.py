@@ -6,22 +6,32 @@ import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from ..models import AnalysisMetadata, AnalysisResult
-from ..services import S3Service, BedrockLLMService, WebScrapingService, ApifyService
+from ..core.config import get_config
+from ..core.ids import generate_id
+from ..models import AnalysisMetadata, AnalysisResult, FilterCriteria
+from ..services import WebScrapingService, ApifyService, get_bedrock_service, get_s3_service
 from ..utils import ScoringEngine, LeadQualificationEngine
 
 logger = logging.getLogger(__name__)
 
 # Initialize services
-s3_service = S3Service()
-llm_service = BedrockLLMService()
+s3_service = get_s3_service()
+llm_service = get_bedrock_service()
 web_scraper = WebScrapingService()
 apify_service = ApifyService()
 scoring_engine = ScoringEngine()
 qualification_engine = LeadQualificationEngine()
 
+# bulk_filter only reads stored analyses, so it can fan out much wider than
+# bulk_analyze, which is bound by Bedrock rate limits
+BULK_FILTER_CONCURRENCY = 16
+
+# In-flight analyze_company runs keyed by their arguments, so concurrent
+# requests for the same company share one pipeline run
+_inflight_analyses: Dict[tuple, "asyncio.Task[Dict[str, Any]]"] = {}
+
 
 async def analyze_company(
     company_name: str,
@@ -32,6 +42,30 @@ async def analyze_company(
     manual_override: bool = False
 ) -> Dict[str, Any]:
     """Orchestrates complete company analysis with scoring and qualification"""
+    key = (company_name, website_url, linkedin_url, force_refresh, skip_filtering, manual_override)
+    task = _inflight_analyses.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_analyze_company(*key))
+        _inflight_analyses[key] = task
+        task.add_done_callback(lambda _: _inflight_analyses.pop(key, None))
+    else:
+        logger.info(f"Joining in-flight analysis for company: {company_name}")
+    
+    # Shielded so one caller being cancelled does not cancel the others' run;
+    # each caller gets its own copy of the result dict
+    result = await asyncio.shield(task)
+    return dict(result)
+
+
+async def _analyze_company(
+    company_name: str,
+    website_url: str,
+    linkedin_url: str,
+    force_refresh: bool,
+    skip_filtering: bool,
+    manual_override: bool
+) -> Dict[str, Any]:
+    """Run the full analysis pipeline for one company"""
     analysis_start_time = time.time()
     
     try:
@@ -39,7 +73,7 @@ async def analyze_company(
         
         # Generate analysis ID and timestamp
         analysis_timestamp = datetime.utcnow().isoformat() + 'Z'
-        analysis_id = f"{company_name.lower().replace(' ', '-')}_{int(time.time())}"
+        analysis_id = generate_id(company_name.lower().replace(' ', '-'))
         
         # Check for existing analysis if not forcing refresh
         if not force_refresh:
@@ -49,7 +83,7 @@ async def analyze_company(
                 return {
                     "success": True,
                     "is_qualified": existing_analysis.qualification_result.is_qualified,
-                    "filtering_result": existing_analysis.filtering_result.dict(),
+                    "filtering_result": existing_analysis.filtering_result.model_dump(),
                     "s3_path": f"s3://{s3_service.bucket_name}/companies/{s3_service._sanitize_company_name(company_name)}/latest",
                     "analysis_summary": {
                         "overall_score": existing_analysis.overall_score,
@@ -59,19 +93,22 @@ async def analyze_company(
                     "from_cache": True
                 }
         
-        # Step 1: Scrape website
+        # Steps 1-2: Scrape website and get LinkedIn data (if provided)
+        # concurrently; both helpers report failures in their result dicts
         logger.info(f"Scraping website: {website_url}")
-        website_data = await scrape_website(website_url, max_pages=5)
+        fetches = [scrape_website(website_url, max_pages=5)]
+        if linkedin_url:
+            logger.info(f"Getting LinkedIn data: {linkedin_url}")
+            fetches.append(get_linkedin_data(linkedin_url, force_refresh))
+        website_data, *linkedin_results = await asyncio.gather(*fetches)
         
         if not website_data["success"]:
             logger.warning(f"Website scraping failed: {website_data.get('error', 'Unknown error')}")
             website_data = {"success": False, "error": "Website scraping failed"}
         
-        # Step 2: Get LinkedIn data if provided
         linkedin_data = None
-        if linkedin_url:
-            logger.info(f"Getting LinkedIn data: {linkedin_url}")
-            linkedin_result = await get_linkedin_data(linkedin_url, force_refresh)
+        if linkedin_results:
+            linkedin_result = linkedin_results[0]
             if linkedin_result["success"]:
                 linkedin_data = linkedin_result["company_data"]
             else:
@@ -130,7 +167,7 @@ async def analyze_company(
                     return {
                         "success": True,
                         "is_qualified": False,
-                        "filtering_result": filtering_result.dict(),
+                        "filtering_result": filtering_result.model_dump(),
                         "s3_path": s3_path,
                         "analysis_summary": {
                             "overall_score": 0.0,
@@ -219,7 +256,7 @@ async def analyze_company(
         return {
             "success": True,
             "is_qualified": qualification_result.is_qualified if qualification_result else True,
-            "filtering_result": filtering_result.dict() if filtering_result else {},
+            "filtering_result": filtering_result.model_dump() if filtering_result else {},
             "s3_path": s3_path,
             "analysis_summary": {
                 "overall_score": analysis_result.overall_score,
@@ -252,7 +289,7 @@ def create_partial_analysis_result(
     from ..models import AnalysisMetadata
     
     metadata = AnalysisMetadata(
-        analysis_id=f"{company_name.lower().replace(' ', '-')}_{int(time.time())}",
+        analysis_id=generate_id(company_name.lower().replace(' ', '-')),
         created_at=analysis_timestamp,
         analysis_duration_seconds=0.0,
         bedrock_tokens_used=0,
@@ -525,14 +562,14 @@ async def compare_analyses(
 
 async def bulk_analyze(
     companies: List[Dict[str, str]],
-    max_parallel: int = 3
+    max_parallel: int = 5
 ) -> Dict[str, Any]:
     """Parallel analysis of multiple companies"""
     try:
         logger.info(f"Starting bulk analysis of {len(companies)} companies")
         
         # Limit parallelism
-        max_parallel = min(max_parallel, 5)  # Safety limit
+        max_parallel = min(max_parallel, get_config().MAX_PARALLEL_ANALYSES)  # Safety limit
         
         results = []
         semaphore = asyncio.Semaphore(max_parallel)
@@ -608,77 +645,83 @@ async def bulk_analyze(
 
 async def bulk_filter(
     companies: List[str],
-    criteria: Dict[str, Any]
+    criteria: Union[FilterCriteria, Dict[str, Any]]
 ) -> Dict[str, Any]:
     """Filter multiple companies against qualification criteria"""
     try:
+        criteria = FilterCriteria.model_validate(criteria)
         logger.info(f"Filtering {len(companies)} companies against criteria")
         
-        filtered_results = []
+        semaphore = asyncio.Semaphore(BULK_FILTER_CONCURRENCY)
         
-        for company_name in companies:
-            try:
-                # Get latest analysis
-                analysis = await s3_service.get_analysis_result(company_name)
-                
-                if not analysis:
-                    filtered_results.append({
+        async def filter_single_company(company_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    # Get latest analysis
+                    analysis = await s3_service.get_analysis_result(company_name)
+                    
+                    if not analysis:
+                        return {
+                            "company_name": company_name,
+                            "matches_criteria": False,
+                            "reason": "No analysis found"
+                        }
+                    
+                    # Check criteria
+                    matches = True
+                    reasons = []
+                    
+                    # Check score criteria
+                    if criteria.min_score is not None:
+                        if analysis.overall_score < criteria.min_score:
+                            matches = False
+                            reasons.append(f"Score {analysis.overall_score} < {criteria.min_score}")
+                    
+                    if criteria.max_score is not None:
+                        if analysis.overall_score > criteria.max_score:
+                            matches = False
+                            reasons.append(f"Score {analysis.overall_score} > {criteria.max_score}")
+                    
+                    # Check tier criteria
+                    if criteria.tier is not None:
+                        if analysis.effective_tier != criteria.tier:
+                            matches = False
+                            reasons.append(f"Tier {analysis.effective_tier} != {criteria.tier}")
+                    
+                    # Check qualification criteria
+                    if criteria.qualified is not None:
+                        if analysis.qualification_result.is_qualified != criteria.qualified:
+                            matches = False
+                            reasons.append(f"Qualified {analysis.qualification_result.is_qualified} != {criteria.qualified}")
+                    
+                    return {
+                        "company_name": company_name,
+                        "matches_criteria": matches,
+                        "overall_score": analysis.overall_score,
+                        "tier": analysis.effective_tier,
+                        "qualified": analysis.qualification_result.is_qualified,
+                        "reasons": reasons if not matches else []
+                    }
+                    
+                except Exception as e:
+                    logger.error(f"Error filtering company {company_name}: {e}")
+                    return {
                         "company_name": company_name,
                         "matches_criteria": False,
-                        "reason": "No analysis found"
-                    })
-                    continue
-                
-                # Check criteria
-                matches = True
-                reasons = []
-                
-                # Check score criteria
-                if "min_score" in criteria:
-                    if analysis.overall_score < criteria["min_score"]:
-                        matches = False
-                        reasons.append(f"Score {analysis.overall_score} < {criteria['min_score']}")
-                
-                if "max_score" in criteria:
-                    if analysis.overall_score > criteria["max_score"]:
-                        matches = False
-                        reasons.append(f"Score {analysis.overall_score} > {criteria['max_score']}")
-                
-                # Check tier criteria
-                if "tier" in criteria:
-                    if analysis.effective_tier != criteria["tier"]:
-                        matches = False
-                        reasons.append(f"Tier {analysis.effective_tier} != {criteria['tier']}")
-                
-                # Check qualification criteria
-                if "qualified" in criteria:
-                    if analysis.qualification_result.is_qualified != criteria["qualified"]:
-                        matches = False
-                        reasons.append(f"Qualified {analysis.qualification_result.is_qualified} != {criteria['qualified']}")
-                
-                filtered_results.append({
-                    "company_name": company_name,
-                    "matches_criteria": matches,
-                    "overall_score": analysis.overall_score,
-                    "tier": analysis.effective_tier,
-                    "qualified": analysis.qualification_result.is_qualified,
-                    "reasons": reasons if not matches else []
-                })
-                
-            except Exception as e:
-                logger.error(f"Error filtering company {company_name}: {e}")
-                filtered_results.append({
-                    "company_name": company_name,
-                    "matches_criteria": False,
-                    "reason": f"Error: {str(e)}"
-                })
+                        "reason": f"Error: {str(e)}"
+                    }
+        
+        # Results keep the order of the input list
+        filtered_results = await asyncio.gather(
+            *(filter_single_company(company_name) for company_name in companies)
+        )
         
         # Generate summary
         matching_companies = [r for r in filtered_results if r["matches_criteria"]]
         
         return {
             "success": True,
-            "criteria": criteria,
+            "criteria": criteria.model_dump(exclude_none=True),
             "total_companies": len(companies),
             "matching_companies": len(matching_companies),
             "match_rate": len(matching_companies) / len(companies) if companies else 0.0,
@@ -835,9 +878,9 @@ async def generate_investment_thesis(
             if not analysis_results:
                 analysis_results = {
                     "overall_score": analysis.overall_score,
-                    "dimension_scores": {k: v.dict() for k, v in analysis.default_scores.items()},
+                    "dimension_scores": {k: v.model_dump() for k, v in analysis.default_scores.items()},
                     "tier": analysis.effective_tier,
-                    "qualification_result": analysis.qualification_result.dict()
+                    "qualification_result": analysis.qualification_result.model_dump()
                 }
         
         # Generate thesis using LLM
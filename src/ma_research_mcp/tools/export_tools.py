@@ -6,21 +6,18 @@ import csv
 import io
 import json
 import logging
-import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
+import xlsxwriter
 
-from ..services import S3Service
+from ..core.ids import generate_id
+from ..services import get_s3_service
 
 logger = logging.getLogger(__name__)
 
 # Initialize services
-s3_service = S3Service()
+s3_service = get_s3_service()
 
 
 async def export_report(
@@ -80,7 +77,7 @@ async def export_report(
                     company_data["confidence_level"] = analysis.investment_thesis.confidence_level
                 
                 if include_raw_data:
-                    company_data["raw_analysis"] = analysis.dict()
+                    company_data["raw_analysis"] = analysis.model_dump()
                 
                 companies_data.append(company_data)
             else:
@@ -107,7 +104,7 @@ async def export_report(
             }
             
             # Save to S3
-            export_id = f"export_{int(time.time())}"
+            export_id = generate_id("export")
             s3_key = f"exports/{datetime.now().strftime('%Y-%m-%d')}/{export_id}.json"
             
             await s3_service._save_json_object(s3_key, report_content)
@@ -157,16 +154,10 @@ async def export_report(
             csv_content = csv_buffer.getvalue()
             
             # Save to S3
-            export_id = f"export_{int(time.time())}"
+            export_id = generate_id("export")
             s3_key = f"exports/{datetime.now().strftime('%Y-%m-%d')}/{export_id}.csv"
             
-            await s3_service.s3_client.put_object(
-                Bucket=s3_service.bucket_name,
-                Key=s3_key,
-                Body=csv_content.encode('utf-8'),
-                ContentType='text/csv',
-                ServerSideEncryption='AES256'
-            )
+            await s3_service.save_file_object(s3_key, csv_content.encode('utf-8'), 'text/csv')
             
             # Generate presigned URL
             presigned_url = await s3_service.generate_presigned_url(s3_key, expiration=3600)
@@ -288,96 +279,37 @@ async def generate_xlsx_export(
                 "Value": count
             })
         
-        # Create Excel workbook
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
-        
-        # Create sheets
-        summary_ws = wb.create_sheet("Summary")
-        companies_ws = wb.create_sheet("Companies")
-        dimensions_ws = wb.create_sheet("Dimension Scores")
-        
-        # Summary sheet
-        summary_df = pd.DataFrame(summary_data)
-        for r in dataframe_to_rows(summary_df, index=False, header=True):
-            summary_ws.append(r)
-        
-        # Format summary sheet
-        summary_ws['A1'].font = Font(bold=True)
-        summary_ws['B1'].font = Font(bold=True)
-        for row in summary_ws.iter_rows(min_row=1, max_row=1):
-            for cell in row:
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.font = Font(color="FFFFFF", bold=True)
-        
-        # Companies sheet
-        companies_df = pd.DataFrame(companies_data)
-        for r in dataframe_to_rows(companies_df, index=False, header=True):
-            companies_ws.append(r)
-        
-        # Format companies sheet
-        for row in companies_ws.iter_rows(min_row=1, max_row=1):
-            for cell in row:
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.font = Font(color="FFFFFF", bold=True)
-        
-        # Add conditional formatting for scores
-        for row_num in range(2, len(companies_data) + 2):
-            score_cell = companies_ws[f'D{row_num}']  # Overall Score column
-            score_value = score_cell.value
-            
-            if score_value >= 8.0:
-                score_cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")  # Light green
-            elif score_value >= 6.0:
-                score_cell.fill = PatternFill(start_color="FFFFE0", end_color="FFFFE0", fill_type="solid")  # Light yellow
-            elif score_value >= 4.0:
-                score_cell.fill = PatternFill(start_color="FFE4B5", end_color="FFE4B5", fill_type="solid")  # Light orange
-            else:
-                score_cell.fill = PatternFill(start_color="FFB6C1", end_color="FFB6C1", fill_type="solid")  # Light red
+        # Create Excel workbook. constant_memory streams each row to a temp
+        # file as it is written instead of holding every cell in memory, so
+        # rows are written strictly top to bottom with formats applied inline.
+        excel_buffer = io.BytesIO()
+        wb = xlsxwriter.Workbook(excel_buffer, {"constant_memory": True})
+        header_format = wb.add_format({"bold": True, "font_color": "#FFFFFF", "bg_color": "#366092"})
+        score_formats = [
+            (8.0, wb.add_format({"bg_color": "#90EE90"})),  # Light green
+            (6.0, wb.add_format({"bg_color": "#FFFFE0"})),  # Light yellow
+            (4.0, wb.add_format({"bg_color": "#FFE4B5"})),  # Light orange
+            (float("-inf"), wb.add_format({"bg_color": "#FFB6C1"})),  # Light red
+        ]
         
-        # Dimensions sheet
-        if dimension_data:
-            dimensions_df = pd.DataFrame(dimension_data)
-            for r in dataframe_to_rows(dimensions_df, index=False, header=True):
-                dimensions_ws.append(r)
-            
-            # Format dimensions sheet
-            for row in dimensions_ws.iter_rows(min_row=1, max_row=1):
-                for cell in row:
-                    cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    cell.font = Font(color="FFFFFF", bold=True)
+        def score_format(score: float):
+            return next(fmt for threshold, fmt in score_formats if score >= threshold)
         
-        # Auto-adjust column widths
-        for ws in [summary_ws, companies_ws, dimensions_ws]:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+        _write_sheet(wb, "Summary", summary_data, header_format)
+        _write_sheet(wb, "Companies", companies_data, header_format, {"Overall Score": score_format})
+        _write_sheet(wb, "Dimension Scores", dimension_data, header_format)
         
-        # Save to buffer
-        excel_buffer = io.BytesIO()
-        wb.save(excel_buffer)
+        wb.close()
         excel_content = excel_buffer.getvalue()
         
         # Save to S3
-        export_id = f"xlsx_export_{int(time.time())}"
+        export_id = generate_id("xlsx_export")
         s3_key = f"exports/{datetime.now().strftime('%Y-%m-%d')}/xlsx_exports/{export_id}.xlsx"
         
-        await s3_service.s3_client.put_object(
-            Bucket=s3_service.bucket_name,
-            Key=s3_key,
-            Body=excel_content,
-            ContentType='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            ServerSideEncryption='AES256'
+        await s3_service.save_file_object(
+            s3_key,
+            excel_content,
+            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
         )
         
         # Generate presigned URL (24 hour expiration)
@@ -400,4 +332,40 @@ async def generate_xlsx_export(
         return {
             "success": False,
             "error": str(e)
-        }
\ No newline at end of file
+        }
+
+
+def _write_sheet(
+    workbook: "xlsxwriter.Workbook",
+    name: str,
+    rows: List[Dict[str, Any]],
+    header_format: Any,
+    cell_formats: Optional[Dict[str, Any]] = None
+) -> None:
+    """Write dict rows to a new worksheet with a formatted header row"""
+    ws = workbook.add_worksheet(name)
+    if not rows:
+        return
+    
+    # Columns in order of first appearance across all rows
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    cell_formats = cell_formats or {}
+    
+    # Column widths must be known up front since rows cannot be revisited
+    for col, column in enumerate(columns):
+        max_length = max(
+            [len(str(column))] + [len(str(row[column])) for row in rows if row.get(column) is not None]
+        )
+        ws.set_column(col, col, min(max_length + 2, 50))
+    
+    ws.write_row(0, 0, columns, header_format)
+    for row_num, row in enumerate(rows, start=1):
+        for col, column in enumerate(columns):
+            value = row.get(column)
+            if value is None:
+                continue
+            format_for = cell_formats.get(column)
+            if format_for is not None:
+                ws.write(row_num, col, value, format_for(value))
+            else:
+                ws.write(row_num, col, value)
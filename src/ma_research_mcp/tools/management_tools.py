@@ -8,12 +8,12 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..models import ScoringSystem, CompanyList, OverrideMetadata
-from ..services import S3Service
+from ..services import get_s3_service
 
 logger = logging.getLogger(__name__)
 
 # Initialize services
-s3_service = S3Service()
+s3_service = get_s3_service()
 
 
 async def manage_scoring_systems(
@@ -60,7 +60,7 @@ async def manage_scoring_systems(
             return {
                 "success": True,
                 "action": "get",
-                "scoring_system": scoring_system.dict()
+                "scoring_system": scoring_system.model_dump()
             }
         
         elif action == "list":
@@ -89,7 +89,7 @@ async def manage_scoring_systems(
                 }
             
             # Update system
-            updated_data = existing_system.dict()
+            updated_data = existing_system.model_dump()
             updated_data.update(system_data)
             updated_data["updated_at"] = datetime.utcnow().isoformat() + 'Z'
             
@@ -119,7 +119,7 @@ async def manage_scoring_systems(
                 }
             
             # Mark as inactive
-            updated_data = existing_system.dict()
+            updated_data = existing_system.model_dump()
             updated_data["is_active"] = False
             updated_data["updated_at"] = datetime.utcnow().isoformat() + 'Z'
             
@@ -242,7 +242,7 @@ async def manage_company_lists(
             existing_list = [entry for entry in existing_list if entry.get("company_name") != company_name]
             
             # Add new entry
-            existing_list.append(company_list_entry.dict())
+            existing_list.append(company_list_entry.model_dump())
             
             await s3_service._save_json_object(index_file, existing_list)
             
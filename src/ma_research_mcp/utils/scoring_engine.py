@@ -7,7 +7,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from ..models import DEFAULT_SCORING_DIMENSIONS, ScoringDimension, ScoringSystem, ScoreDimension
-from ..services import BedrockLLMService, S3Service
+from ..services import get_bedrock_service, get_s3_service
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +16,8 @@ class ScoringEngine:
     """8-dimension scoring system with LLM evaluation"""
     
     def __init__(self):
-        self.llm_service = BedrockLLMService()
-        self.s3_service = S3Service()
+        self.llm_service = get_bedrock_service()
+        self.s3_service = get_s3_service()
         
         # Initialize default scoring system
         self.default_system = self._create_default_scoring_system()
@@ -242,16 +242,14 @@ Score 5-9 where:
             total_weights = 0.0
             errors = []
             
-            # Process dimensions in parallel for efficiency
-            tasks = []
-            for dimension in scoring_system.dimensions:
-                task = self._score_dimension(dimension, company_data)
-                tasks.append((dimension.dimension_id, task))
+            score_results = await self._score_dimensions(scoring_system.dimensions, company_data)
             
-            # Wait for all scoring tasks
-            for dimension_id, task in tasks:
+            for dimension in scoring_system.dimensions:
+                dimension_id = dimension.dimension_id
                 try:
-                    score_result = await task
+                    score_result = score_results[dimension_id]
+                    if isinstance(score_result, Exception):
+                        raise score_result
                     if score_result["success"]:
                         dimension_score = score_result["dimension_score"]
                         dimension_scores[dimension_id] = ScoreDimension(
@@ -292,7 +290,7 @@ Score 5-9 where:
                 "success": True,
                 "scoring_system_id": scoring_system_id,
                 "scoring_system_name": scoring_system.system_name,
-                "dimension_scores": {k: v.dict() for k, v in dimension_scores.items()},
+                "dimension_scores": {k: v.model_dump() for k, v in dimension_scores.items()},
                 "overall_score": round(overall_score, 2),
                 "weighted_score": round(total_weighted_score, 2),
                 "total_weights": total_weights,
@@ -311,6 +309,48 @@ Score 5-9 where:
                 "error": str(e)
             }
     
+    async def _score_dimensions(
+        self,
+        dimensions: List[ScoringDimension],
+        company_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Score all dimensions in one LLM call, then singly for any it missed"""
+        batch = await self.llm_service.score_dimensions_batch(
+            [
+                {
+                    "name": dimension.dimension_name,
+                    "description": dimension.description,
+                    "scoring_criteria": dimension.scoring_criteria,
+                    "min_score": dimension.min_score,
+                    "max_score": dimension.max_score
+                }
+                for dimension in dimensions
+            ],
+            company_data
+        )
+        batch_scores = batch.get("dimension_scores", {}) if batch["success"] else {}
+        
+        results = {}
+        remaining = []
+        for dimension in dimensions:
+            dimension_score = batch_scores.get(dimension.dimension_name)
+            if dimension_score is None:
+                remaining.append(dimension)
+            else:
+                dimension_score["dimension_name"] = dimension.dimension_name
+                results[dimension.dimension_id] = {"success": True, "dimension_score": dimension_score}
+        
+        if remaining:
+            logger.warning(f"Batch scoring missed {len(remaining)} dimensions, scoring individually")
+            singles = await asyncio.gather(
+                *[self._score_dimension(dimension, company_data) for dimension in remaining],
+                return_exceptions=True
+            )
+            for dimension, result in zip(remaining, singles):
+                results[dimension.dimension_id] = result
+        
+        return results
+    
     async def _score_dimension(
         self,
         dimension: ScoringDimension,
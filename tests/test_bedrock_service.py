@@ -0,0 +1,141 @@
+"""
+Tests for the Bedrock LLM service
+"""
+
+import asyncio
+import io
+
+import orjson
+import pytest
+from botocore.exceptions import EventStreamError
+
+from ma_research_mcp.core.cache import LLMResponseCache
+from ma_research_mcp.services.bedrock_service import STREAM_MIN_MAX_TOKENS, BedrockLLMService
+
+
+@pytest.fixture
+def service():
+    """Service with a private response cache, so tests don't share results"""
+    service = BedrockLLMService()
+    service.cache = LLMResponseCache(maxsize=16, ttl=60)
+    return service
+
+
+def stub_generate(service, monkeypatch, release):
+    """Replace the uncached call path with one that waits for ``release``"""
+    calls = []
+
+    async def fake_generate_response(key, model_id, *args):
+        calls.append(model_id)
+        await release.wait()
+        return {"success": True, "response": "ok", "model_used": model_id, "tokens_used": 1}
+
+    monkeypatch.setattr(service, "_generate_response", fake_generate_response)
+    return calls
+
+
+async def settle():
+    """Let started tasks run up to their first blocking await"""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call(service, monkeypatch):
+    release = asyncio.Event()
+    calls = stub_generate(service, monkeypatch, release)
+
+    first = asyncio.create_task(service.generate_response("prompt"))
+    second = asyncio.create_task(service.generate_response("prompt"))
+    await settle()
+    release.set()
+
+    results = await asyncio.gather(first, second)
+    assert len(calls) == 1
+    assert results[0] == results[1]
+    assert results[0]["success"]
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_waiter_makes_call_when_owner_is_cancelled(service, monkeypatch):
+    release = asyncio.Event()
+    calls = stub_generate(service, monkeypatch, release)
+
+    owner = asyncio.create_task(service.generate_response("prompt"))
+    await settle()
+    waiter = asyncio.create_task(service.generate_response("prompt"))
+    await settle()
+
+    owner.cancel()
+    await settle()
+    release.set()
+
+    result = await waiter
+    assert owner.cancelled()
+    assert result["success"]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_owner(service, monkeypatch):
+    release = asyncio.Event()
+    calls = stub_generate(service, monkeypatch, release)
+
+    owner = asyncio.create_task(service.generate_response("prompt"))
+    await settle()
+    waiter = asyncio.create_task(service.generate_response("prompt"))
+    await settle()
+
+    waiter.cancel()
+    await settle()
+    release.set()
+
+    result = await owner
+    assert waiter.cancelled()
+    assert result["success"]
+    assert len(calls) == 1
+
+
+class ThrottledStreamClient:
+    """bedrock-runtime stub whose response stream fails with a throttling event"""
+
+    def __init__(self):
+        self.calls = []
+
+    def invoke_model_with_response_stream(self, modelId, **kwargs):
+        self.calls.append(("stream", modelId))
+        return {"body": self._events()}
+
+    def _events(self):
+        message_start = b'{"type":"message_start","message":{"usage":{"input_tokens":5}}}'
+        yield {"chunk": {"bytes": message_start}}
+        # What botocore's EventStream raises on a throttlingException event
+        raise EventStreamError(
+            {"Error": {"Code": "throttlingException", "Message": "Too many requests"}},
+            "InvokeModelWithResponseStream"
+        )
+
+    def invoke_model(self, modelId, **kwargs):
+        self.calls.append(("invoke", modelId))
+        body = {
+            "inputTextTokenCount": 5,
+            "results": [{"outputText": "fallback", "tokenCount": 1, "completionReason": "FINISH"}]
+        }
+        return {"body": io.BytesIO(orjson.dumps(body))}
+
+
+@pytest.mark.asyncio
+async def test_throttle_inside_stream_falls_back_once(service):
+    client = ThrottledStreamClient()
+    service.bedrock_client = client
+    service._model_families = {
+        service.primary_model: "anthropic.claude-3-5-sonnet",
+        service.fallback_model: "amazon.nova-pro"
+    }
+
+    result = await service.generate_response("prompt", max_tokens=STREAM_MIN_MAX_TOKENS)
+
+    assert result["success"]
+    assert result["model_used"] == service.fallback_model
+    assert client.calls == [("stream", service.primary_model), ("invoke", service.fallback_model)]
@@ -0,0 +1,52 @@
+"""
+Tests for the in-process and persistent caches
+"""
+
+import os
+
+import pytest
+
+from ma_research_mcp.core.cache import LinkedInCache
+
+URL = "https://linkedin.com/company/acme"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LinkedInCache(path=str(tmp_path / "cache" / "apify_cache.db"), ttl=60)
+
+
+@pytest.fixture
+def broken_cache(tmp_path):
+    """Cache whose database directory can't be created"""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    return LinkedInCache(path=str(blocker / "apify_cache.db"), ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_round_trip(cache):
+    await cache.put_many([(URL, {"name": "Acme"}, {"raw": 1})])
+    entry = await cache.get(URL)
+    assert entry["company_data"] == {"name": "Acme"}
+    assert await cache.get_many([URL, "other"]) == {URL: entry}
+    assert cache.stats() == {"cache_hits": 2, "cache_misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_unusable_database_degrades_to_misses(broken_cache):
+    await broken_cache.put(URL, {"name": "Acme"}, {})
+    await broken_cache.put_many([(URL, {"name": "Acme"}, {})])
+    assert await broken_cache.get(URL) is None
+    assert await broken_cache.get_many([URL, "other"]) == {}
+    assert broken_cache.stats() == {"cache_hits": 0, "cache_misses": 3}
+
+
+@pytest.mark.asyncio
+async def test_corrupt_database_degrades_to_misses(cache):
+    os.makedirs(os.path.dirname(cache.path))
+    with open(cache.path, "wb") as f:
+        f.write(b"this is not a sqlite database" * 100)
+    await cache.put(URL, {"name": "Acme"}, {})
+    assert await cache.get(URL) is None
+    assert await cache.get_many([URL]) == {}
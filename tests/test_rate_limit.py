@@ -0,0 +1,61 @@
+"""
+Tests for the async token bucket
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from ma_research_mcp.core import rate_limit
+from ma_research_mcp.core.rate_limit import TokenBucket
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Drive the bucket from a fake clock that only sleeping advances"""
+    now = [0.0]
+    recorded = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+        now[0] += delay
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(rate_limit, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=fake_sleep))
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_burst_up_to_capacity_without_waiting(sleeps):
+    bucket = TokenBucket(capacity=3, interval=1.0)
+    for _ in range(3):
+        await bucket.acquire()
+    assert sleeps == []
+    assert bucket.tokens == pytest.approx(0.0)
+
+
+@pytest.mark.asyncio
+async def test_empty_bucket_paces_at_interval(sleeps):
+    bucket = TokenBucket(capacity=2, interval=0.5)
+    for _ in range(4):
+        await bucket.acquire()
+    assert sleeps == [pytest.approx(0.5), pytest.approx(0.5)]
+
+
+@pytest.mark.asyncio
+async def test_acquire_more_than_capacity_is_clamped(sleeps):
+    bucket = TokenBucket(capacity=2, interval=1.0)
+    await bucket.acquire(5)
+    assert sleeps == []
+    assert bucket.tokens == pytest.approx(0.0)
+
+
+@pytest.mark.asyncio
+async def test_charge_overdraws_and_delays_next_acquire(sleeps):
+    bucket = TokenBucket(capacity=5, interval=1.0)
+    bucket.charge(7)
+    assert bucket.tokens == pytest.approx(-2.0)
+    await bucket.acquire()
+    assert sleeps == [pytest.approx(3.0)]